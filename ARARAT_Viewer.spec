@@ -2,6 +2,7 @@
 
 from pathlib import Path
 import os
+import importlib.util
 from PyInstaller.utils.hooks import collect_submodules, collect_dynamic_libs, collect_data_files
 
 root = Path(os.getcwd()).resolve()
@@ -24,6 +25,13 @@ hiddenimports = [
 ]
 hiddenimports += collect_submodules("radiomics")
 
+# aceleracoes opcionais (ver requirements.txt): so entram no EXE se instaladas no ambiente de build
+for _opt in ("numba", "orjson"):
+    if importlib.util.find_spec(_opt) is not None:
+        hiddenimports.append(_opt)
+    else:
+        print(f"[spec] {_opt} nao instalado: o EXE usara o fallback mais lento")
+
 binaries = []
 binaries += collect_dynamic_libs("SimpleITK")
 
@@ -0,0 +1,114 @@
+import sys
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# no EXE (PyInstaller) nao ha .py no disco e o cache do numba falha ja na definicao do kernel
+_NUMBA_CACHE = not getattr(sys, "frozen", False)
+
+
+def _sample_plane_numpy(vol, p0, du, dv, nu, nv):
+    v_idx, u_idx = np.mgrid[0:nv, 0:nu]
+    # coordenadas continuas (i, j, k) de cada pixel do plano
+    pts = p0[None, None, :] + u_idx[..., None] * du[None, None, :] + v_idx[..., None] * dv[None, None, :]
+    shape_ijk = np.array(vol.shape[::-1], dtype=np.float64)
+    inside = ((pts >= -0.5) & (pts < shape_ijk - 0.5)).all(axis=-1)
+    pts = np.clip(pts, 0.0, shape_ijk - 1.0)
+    base = np.minimum(np.floor(pts).astype(np.int64), (shape_ijk - 2).clip(0).astype(np.int64))
+    frac = pts - base
+    i0, j0, k0 = base[..., 0], base[..., 1], base[..., 2]
+    i1 = np.minimum(i0 + 1, vol.shape[2] - 1)
+    j1 = np.minimum(j0 + 1, vol.shape[1] - 1)
+    k1 = np.minimum(k0 + 1, vol.shape[0] - 1)
+    fi, fj, fk = frac[..., 0], frac[..., 1], frac[..., 2]
+    c00 = vol[k0, j0, i0] * (1 - fi) + vol[k0, j0, i1] * fi
+    c01 = vol[k0, j1, i0] * (1 - fi) + vol[k0, j1, i1] * fi
+    c10 = vol[k1, j0, i0] * (1 - fi) + vol[k1, j0, i1] * fi
+    c11 = vol[k1, j1, i0] * (1 - fi) + vol[k1, j1, i1] * fi
+    c0 = c00 * (1 - fj) + c01 * fj
+    c1 = c10 * (1 - fj) + c11 * fj
+    out = c0 * (1 - fk) + c1 * fk
+    return np.where(inside, out, 0.0).astype(np.float32)
+
+
+if numba is not None:
+    try:
+        @numba.njit(parallel=True, fastmath=True, cache=_NUMBA_CACHE)
+        def _sample_plane_numba(vol, p0, du, dv, nu, nv):
+            nk, nj, ni = vol.shape
+            out = np.zeros((nv, nu), np.float32)
+            for r in numba.prange(nv):
+                for c in range(nu):
+                    x = p0[0] + c * du[0] + r * dv[0]
+                    y = p0[1] + c * du[1] + r * dv[1]
+                    z = p0[2] + c * du[2] + r * dv[2]
+                    if x < -0.5 or y < -0.5 or z < -0.5 or x >= ni - 0.5 or y >= nj - 0.5 or z >= nk - 0.5:
+                        continue
+                    x = min(max(x, 0.0), ni - 1.0)
+                    y = min(max(y, 0.0), nj - 1.0)
+                    z = min(max(z, 0.0), nk - 1.0)
+                    i0 = min(int(x), max(ni - 2, 0))
+                    j0 = min(int(y), max(nj - 2, 0))
+                    k0 = min(int(z), max(nk - 2, 0))
+                    i1 = min(i0 + 1, ni - 1)
+                    j1 = min(j0 + 1, nj - 1)
+                    k1 = min(k0 + 1, nk - 1)
+                    fi = np.float32(x - i0)
+                    fj = np.float32(y - j0)
+                    fk = np.float32(z - k0)
+                    c00 = vol[k0, j0, i0] * (1 - fi) + vol[k0, j0, i1] * fi
+                    c01 = vol[k0, j1, i0] * (1 - fi) + vol[k0, j1, i1] * fi
+                    c10 = vol[k1, j0, i0] * (1 - fi) + vol[k1, j0, i1] * fi
+                    c11 = vol[k1, j1, i0] * (1 - fi) + vol[k1, j1, i1] * fi
+                    c0 = c00 * (1 - fj) + c01 * fj
+                    c1 = c10 * (1 - fj) + c11 * fj
+                    out[r, c] = c0 * (1 - fk) + c1 * fk
+            return out
+    except Exception:
+        _sample_plane_numba = None # segue no caminho NumPy/SimpleITK
+else:
+    _sample_plane_numba = None
+
+NUMBA_AVAILABLE = _sample_plane_numba is not None
+
+
+def warmup(dtype, readonly=True):
+    """
+    Compila o kernel para volumes de dtype usando um volume 2x2x2; roda fora da thread
+    da UI. readonly=True casa com o memmap do cache de series. False se nao ha kernel.
+    """
+    if _sample_plane_numba is None:
+        return False
+    vol = np.zeros((2, 2, 2), dtype=dtype)
+    vol.setflags(write=not readonly)
+    try:
+        sample_plane(vol, (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), 2, 2)
+    except Exception:
+        return False
+    return True
+
+
+def sample_plane(vol, p0_ijk, du_ijk, dv_ijk, nu, nv):
+    """
+    Amostra um plano do volume com interpolacao trilinear.
+
+    Args:
+        vol: volume (k, j, i)
+        p0_ijk: voxel continuo (i, j, k) do pixel (0, 0) do plano
+        du_ijk: passo em voxels por coluna do plano
+        dv_ijk: passo em voxels por linha do plano
+        nu, nv: largura e altura do plano em pixels
+
+    Returns:
+        np.ndarray float32 (nv, nu); pontos fora do volume ficam em 0
+    """
+    p0 = np.asarray(p0_ijk, dtype=np.float64)
+    du = np.asarray(du_ijk, dtype=np.float64)
+    dv = np.asarray(dv_ijk, dtype=np.float64)
+    if _sample_plane_numba is not None:
+        return _sample_plane_numba(vol, p0, du, dv, int(nu), int(nv))
+    return _sample_plane_numpy(vol, p0, du, dv, int(nu), int(nv))
@@ -0,0 +1,127 @@
+import sys
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# no EXE (PyInstaller) nao ha .py no disco e o cache do numba falha ja na definicao do kernel
+_NUMBA_CACHE = not getattr(sys, "frozen", False)
+
+ROI_STATUS_NAMES = ("OK", "PARTIAL", "OUT")
+
+
+def _roi_bounds_status_numpy(vox, rvox, shape_ijk):
+    shape = np.asarray(shape_ijk, dtype=np.float64)
+    inside = ((vox >= 0) & (vox < shape)).all(axis=1)
+    partial = ((vox - rvox < 0) | (vox + rvox >= shape)).any(axis=1)
+    return np.where(~inside, 2, np.where(partial, 1, 0)).astype(np.uint8)
+
+
+if numba is not None:
+    try:
+        @numba.njit(cache=_NUMBA_CACHE)
+        def _roi_bounds_status_numba(vox, rvox, shape_ijk):
+            n = vox.shape[0]
+            out = np.empty(n, np.uint8)
+            for r in range(n):
+                status = 0
+                for a in range(3):
+                    v = vox[r, a]
+                    s = shape_ijk[a]
+                    if v < 0 or v >= s:
+                        status = 2
+                        break
+                    if v - rvox[r, a] < 0 or v + rvox[r, a] >= s:
+                        status = 1
+                out[r] = status
+            return out
+    except Exception:
+        _roi_bounds_status_numba = None # segue no caminho NumPy
+else:
+    _roi_bounds_status_numba = None
+
+
+def roi_bounds_status(centers_vox, radii_vox, shape_ijk, use_numba=True):
+    """
+    Classifica esferas de ROI contra os limites do volume.
+
+    Args:
+        centers_vox: array (N, 3) com os centros (i, j, k) em voxel
+        radii_vox: array (N, 3) com o raio em voxels por eixo
+        shape_ijk: tamanho do volume (sz_i, sz_j, sz_k)
+        use_numba: False forca o caminho NumPy (ex.: kernel ainda compilando)
+
+    Returns:
+        np.ndarray uint8 (N,): 0 = OK, 1 = PARTIAL, 2 = OUT (ver ROI_STATUS_NAMES)
+    """
+    vox = np.ascontiguousarray(centers_vox, dtype=np.float64).reshape(-1, 3)
+    rvox = np.ascontiguousarray(radii_vox, dtype=np.float64).reshape(-1, 3)
+    if use_numba and _roi_bounds_status_numba is not None:
+        return _roi_bounds_status_numba(vox, rvox, np.asarray(shape_ijk, dtype=np.float64))
+    return _roi_bounds_status_numpy(vox, rvox, shape_ijk)
+
+
+def _slice_intersections_numpy(pos, radii, slice_pos):
+    d = np.abs(slice_pos - pos)
+    visible = np.flatnonzero(d <= radii)
+    return visible, 2.0 * np.sqrt(radii[visible] ** 2 - d[visible] ** 2)
+
+
+if numba is not None:
+    try:
+        @numba.njit(cache=_NUMBA_CACHE)
+        def _slice_intersections_numba(pos, radii, slice_pos):
+            n = pos.shape[0]
+            visible = np.empty(n, np.int64)
+            diameters = np.empty(n, np.float64)
+            m = 0
+            for r in range(n):
+                d = abs(slice_pos - pos[r])
+                if d <= radii[r]:
+                    visible[m] = r
+                    diameters[m] = 2.0 * np.sqrt(radii[r] * radii[r] - d * d)
+                    m += 1
+            return visible[:m], diameters[:m]
+    except Exception:
+        _slice_intersections_numba = None # segue no caminho NumPy
+else:
+    _slice_intersections_numba = None
+
+
+def warmup():
+    """
+    Compila os kernels numba com entradas minimas; roda fora da thread da UI.
+    False se nao ha kernel ou se a compilacao falhou.
+    """
+    if _roi_bounds_status_numba is None or _slice_intersections_numba is None:
+        return False
+    try:
+        one = np.zeros((1, 3), dtype=np.float64)
+        roi_bounds_status(one, one, (1, 1, 1))
+        slice_intersections(one[:, 0], one[:, 0], 0.0)
+    except Exception:
+        return False
+    return True
+
+
+def slice_intersections(pos_mm, radii_mm, slice_pos_mm, use_numba=True):
+    """
+    Intersecao das esferas de ROI com o plano de uma fatia.
+
+    Args:
+        pos_mm: array (N,) com a coordenada dos centros no eixo normal ao plano (mm)
+        radii_mm: array (N,) com os raios (mm)
+        slice_pos_mm: posicao do plano no mesmo eixo (mm)
+        use_numba: False forca o caminho NumPy (ex.: kernel ainda compilando)
+
+    Returns:
+        (visible, diameters): indices (M,) das ROIs cortadas pelo plano e diametro (mm) de cada circulo
+    """
+    pos = np.ascontiguousarray(pos_mm, dtype=np.float64).reshape(-1)
+    radii = np.ascontiguousarray(radii_mm, dtype=np.float64).reshape(-1)
+    if use_numba and _slice_intersections_numba is not None:
+        return _slice_intersections_numba(pos, radii, float(slice_pos_mm))
+    return _slice_intersections_numpy(pos, radii, float(slice_pos_mm))
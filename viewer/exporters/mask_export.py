@@ -2,7 +2,7 @@ import os
 import numpy as np
 import SimpleITK as sitk
 
-def export_roi_masks(output_dir, reference_sitk_img, rois, case_id):
+def export_roi_masks(output_dir, reference_sitk_img, rois, case_id, compression_level=1):
     """
     Gera máscaras NIfTI 3D para cada ROI, alinhadas à imagem de referência.
     
@@ -11,6 +11,7 @@ def export_roi_masks(output_dir, reference_sitk_img, rois, case_id):
         reference_sitk_img (sitk.Image): Imagem SimpleITK de referência (geometria)
         rois (list): Lista de ROIs confirmadas
         case_id (str): ID do caso para nomeação
+        compression_level (int): nível do gzip (1 = mais rápido; máscaras binárias comprimem bem mesmo assim)
         
     Returns:
         list: Caminhos das máscaras geradas
@@ -59,7 +60,7 @@ def export_roi_masks(output_dir, reference_sitk_img, rois, case_id):
         
         filename = f"mask_{roi_id}.nii.gz"
         filepath = os.path.join(output_dir, filename)
-        sitk.WriteImage(roi_mask_sitk, filepath)
+        sitk.WriteImage(roi_mask_sitk, filepath, useCompression=True, compressionLevel=compression_level)
         generated_paths.append(filepath)
         
     return generated_paths
@@ -9,14 +9,32 @@ import logging
 from datetime import datetime
 import time
 import re
-from PIL import Image
+import shutil
+import gc
+import tempfile
+from collections import OrderedDict
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
 from matplotlib.patches import Circle, Ellipse, Rectangle
+from matplotlib.collections import EllipseCollection, PathCollection
+from matplotlib.markers import MarkerStyle
 from matplotlib.widgets import Button
+from matplotlib.backend_bases import TimerBase
+from matplotlib.figure import Figure
+from matplotlib.colors import Normalize
 import SimpleITK as sitk
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
@@ -24,46 +42,102 @@ if project_root not in sys.path:
 
 try:
     from shared import dicom_io
-    from .exporters import roi_export
-    from .exporters import mask_export
-    from .exporters import pdf_report
-    from . import gt_labels
-    from . import path_utils
-    from .inference_bridge import predict_for_export_folder
-except (ImportError, ValueError) as e:
-    try:
-        from shared import dicom_io
+    from shared import roi_sphere
+    from shared import mpr_slice
+    if __package__:
+        from .exporters import roi_export
+        from .exporters import mask_export
+        from .exporters import pdf_report
+        from . import gt_labels
+        from . import path_utils
+        from .inference_bridge import predict_for_export_folder
+    else:
         from viewer.exporters import roi_export
         from viewer.exporters import mask_export
         from viewer.exporters import pdf_report
         from viewer import gt_labels
         from viewer import path_utils
         from viewer.inference_bridge import predict_for_export_folder
-    except ImportError as e2:
-        print(f"Erro fatal ao importar dependencias: {e2}")
-        try:
-            import tkinter as tk
-            from tkinter import messagebox
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("ARARAT Viewer", f"Erro fatal ao importar dependências:\n{e2}")
-            root.destroy()
-        except Exception:
-            pass
-        sys.exit(1)
+except Exception as e2: # nao so ImportError: no EXE um modulo pode falhar ao inicializar
+    print(f"Erro fatal ao importar dependencias: {e2}")
+    try:
+        import tkinter as tk
+        from tkinter import messagebox
+        root = tk.Tk()
+        root.withdraw()
+        messagebox.showerror("ARARAT Viewer", f"Erro fatal ao importar dependências:\n{e2}")
+        root.destroy()
+    except Exception:
+        pass
+    sys.exit(1)
 
 APP_DIRS = path_utils.ensure_dirs()
 path_utils.init_logging()
 logger = logging.getLogger("ararat.viewer")
 
+# cabecalhos das secoes da sidebar
+_HDR_PATIENTS = "=== PATIENTS ==="
+_HDR_T2 = "=== T2 QUICK ==="
+_HDR_ROIS = "=== ROIs ==="
+_HDR_PREDS = "=== PREDICOES ==="
+_HDR_GT = "=== GT ==="
+
+# schema fixo do roi_manifest.csv
+_MANIFEST_HEADER = "timestamp,case,plane,series_index,series_name,slice_index,x,y,radius_mm,dicom_dir\r\n"
+_CSV_SPECIAL = (",", '"', "\n", "\r")
+
 class ViewerApp:
+    _PLANE_AXIS = {"sagittal": 0, "coronal": 1, "axial": 2} # eixo de center_voxel varrido por plano
+    # (eixo normal, eixo x da tela, eixo y da tela) em indices (i, j, k)
+    _PLANE_AXES = {"axial": (2, 0, 1), "sagittal": (0, 1, 2), "coronal": (1, 0, 2)}
+    # plano de cada slot por main_view; dicts compartilhados, nao alterar
+    _LAYOUTS = {
+        "axial": {"main": "axial", "bottom_left": "coronal", "bottom_right": "sagittal"},
+        "coronal": {"main": "coronal", "bottom_left": "axial", "bottom_right": "sagittal"},
+        "sagittal": {"main": "sagittal", "bottom_left": "axial", "bottom_right": "coronal"},
+    }
+    _logo_cache = {} # {caminho da logo: ndarray}, compartilhado entre instancias (somente leitura)
+
+    @property
+    def center_mm(self):
+        """Centro em mm, recalculado sob demanda a partir de center_voxel."""
+        if self._center_mm is None and self._center_mm_dirty and self._M_vox2mm is not None:
+            self._center_mm = self._v2m(*self.center_voxel).tolist()
+            self._center_mm_dirty = False
+        return self._center_mm
+
+    @center_mm.setter
+    def center_mm(self, value):
+        self._center_mm = value
+        self._center_mm_dirty = False
+
+    @property
+    def sitk_img(self):
+        """
+        sitk.Image da serie atual, montado sob demanda a partir de np_vol/meta: copia o
+        volume inteiro, entao so o resample de fallback, o export e a validacao o pedem.
+        """
+        if self._sitk_img is None and self.np_vol is not None and self.meta is not None:
+            self._sitk_img = self._image_from_volume(self.np_vol, self.meta)
+        return self._sitk_img
+
+    @sitk_img.setter
+    def sitk_img(self, value):
+        self._sitk_img = value
+
+    @property
+    def _series_pages(self):
+        """Numero de paginas da lista de series na sidebar (0 sem series)."""
+        n = len(self.series_list)
+        return (n - 1) // self.series_per_page + 1 if n else 0
+
     def _load_config(self):
         """Carrega configurações persistentes (ex: data_root) de arquivo local."""
         config_path = path_utils.get_config_path()
         if config_path.exists():
             try:
-                with config_path.open('r', encoding="utf-8") as f:
-                    return json.load(f)
+                with config_path.open('rb') as f:
+                    return _json_loads(f.read())
             except:
                 pass
         return {}
@@ -76,8 +150,12 @@ class ViewerApp:
                 "data_root": self.input_root,
                 "samples_root": getattr(self, 'samples_root', None)
             }
-            with config_path.open('w', encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+            if orjson is not None:
+                with config_path.open('wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with config_path.open('w', encoding="utf-8") as f:
+                    json.dump(config, f, indent=2)
         except:
             pass
 
@@ -95,6 +173,9 @@ class ViewerApp:
         self.input_root = str(Path(data_root).resolve()) if data_root else (str(Path(dicom_dir).resolve()) if dicom_dir else None)
         self.dicom_root = self.input_root
         self.series_hint = series_hint
+        self._debug = bool(os.environ.get("ARARAT_DEBUG"))
+        if self._debug:
+            logger.setLevel(logging.DEBUG)
 
         try:
             gt_status = gt_labels.preload_labels(self.input_root)
@@ -110,10 +191,27 @@ class ViewerApp:
                 self.discover_workspace()
             self._save_config()
         
-        # Cache de series (lru simples)
-        self._series_cache = {} # {(case_name, series_idx): (sitk_img, np_vol, meta)}
-        self._cache_order = []
-        self._max_cache_size = 6
+        # Caches LRU (OrderedDict: move_to_end no hit, popitem(last=False) no despejo)
+        # volumes ficam em .npy temporario mapeado (np.load mmap_mode='r'): so as paginas lidas
+        # ocupam RAM e o despejo so fecha o mapa, entao o cache pode guardar mais series;
+        # os arquivos saem em _release_volumes (fim de run() e atexit)
+        self._series_cache = OrderedDict() # {(case_name, series_idx): (np_vol, meta, npy_path)}
+        self._series_load = None # Future da leitura de serie em andamento (pool de I/O)
+        self._prefetch = None # (cache_key, Future) da pre-leitura em andamento
+        self._prefetch_queue = [] # [(cache_key, serie)] a pre-ler, uma por vez
+        self._max_cache_size = 12
+        self._vol_spill_dir = None # diretorio temporario criado no primeiro carregamento
+        self._vol_spill_seq = 0
+        self._vol_spill_lock = threading.Lock() # _spill_volume roda nos workers de I/O
+        self._spill_orphans = [] # .npy cuja remocao falhou (Windows: mapa aberto); ver _release_volumes
+        # fatias 2D reamostradas sob demanda: {(disp_key, plane, idx): np.ndarray}
+        self._slice_cache = OrderedDict()
+        self._max_slice_cache_size = 48
+        # fatias axiais da serie atual em uint8 (min/max), usadas no export de PNG
+        self._slice_u8_cache = OrderedDict()
+        self._max_slice_u8_size = 8
+        # linear basta para exibicao; BSpline fica para quem precisar de qualidade de export
+        self.display_interp = sitk.sitkLinear
 
         # dados do workspace (cases)
         self.cases_list = []
@@ -125,6 +223,8 @@ class ViewerApp:
         self.series_list = []
         self.t2_quick = {'axial': None, 'coronal': None, 'sagittal': None} # indices
         self.current_series_idx = 0
+        self._series_discovery_cache = {} # {dicom_root: (series_list, t2_quick, serie inicial)}
+        self._series_by_uid_cache = None # (series_list, len, {series_uid: serie})
         self.series_page = 0
         self.series_per_page = 20
         
@@ -132,11 +232,19 @@ class ViewerApp:
         self.sitk_img = None
         self.np_vol = None
         self.meta = None
-        self.sitk_img_disp = None
-        self.np_vol_disp = None
-        self.meta_disp = None
+        self.meta_disp = None # grade isotropica de exibicao (so geometria, sem voxels)
+        self._disp_key = None
+        self._M_vox2mm = None # afim 4x4 voxel -> mm da serie atual
+        self._M_mm2vox = None
+        self._M_mm2disp = None # mm -> indice da grade de exibicao
+        # spacing da serie atual e inversos, refeitos em _update_affine_cache
+        self._sx = self._sy = self._sz = 1.0
+        self._inv_sx = self._inv_sy = self._inv_sz = 1.0
+        self._inv_spacing = np.ones(3)
+        self._dz_per_k = 1.0 # mm em z por fatia k (m[2, 2] da afim)
         self.roi_status = {} # {lesion_id: "OK"/"PARTIAL"/"OUT"}
         self.rois_by_patient = {} # {patient_id: [rois]}
+        self._autosave_paths = {} # {case_name: caminho do rois_latest.json}
         
         self.current_slice = 0
         self.max_slice = 0
@@ -152,7 +260,7 @@ class ViewerApp:
         }
         self.view_zoom = {"axial": 1.0, "coronal": 1.0, "sagittal": 1.0}
         self.view_pan = {"axial": (0.0, 0.0), "coronal": (0.0, 0.0), "sagittal": (0.0, 0.0)}
-        self._pan_drag = {"active": False, "plane": None, "start_xy": None, "start_pan": None}
+        self._pan_drag = {"active": False, "plane": None, "start_xy": None, "start_pan": None, "mm_per_px": None}
         self.win = {"axial": None, "coronal": None, "sagittal": None}
         self.level = {"axial": None, "coronal": None, "sagittal": None}
         self._wl_drag = {"active": False, "plane": None, "start_xy": None, "base_win": None, "base_level": None}
@@ -196,14 +304,37 @@ class ViewerApp:
         self.voxel_input_str = ""
 
         self.background = None
+        self._ax_backgrounds = {} # {ax: fundo do painel}; capturados junto com self.background
+        self._im_artists = {"axial": None, "sagittal": None, "coronal": None}
+        # norm fixo (0-255) compartilhado pelos paineis quando a fatia ja chega em uint8
+        self._norm_u8 = Normalize(0, 255, clip=True)
+        self._plane_artists = {"axial": None, "sagittal": None, "coronal": None}
+        self._panel_titles = {}
+        self._text_artists = {}
+        self._panel_text_cache = {} # {painel: (chave de estado, texto)}
+        self._cases_sidebar_template = None # (chave da lista de casos, linhas sem marcador)
+        self._layout_key = None
+        self._last_frame_key = None # ver _frame_key; None forca o proximo quadro
+        self._slots_dirty = True # posicoes dos eixos precisam ser reaplicadas
+        self._pending_update = False
+        self._update_timer = None
+        self._wl_timer = None # coalesce o blit do arraste de W/L
+        self._wl_pending_plane = None
+        # mascaras NIfTI + inferencia do export rodam fora da thread da UI
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ararat-io")
+        # pre-leitura em executor proprio: nunca ocupa o worker de um load pedido pelo usuario
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ararat-prefetch")
+        self._mpr_warmup = {} # {(dtype, readonly): Future de mpr_slice.warmup}
+        self._roi_warmup = None # Future de roi_sphere.warmup
+        self._io_timers = set() # timers de polling ativos (mantem referencia viva)
         self.preview_artists = []
-        self._persistent_artists = {
-            'line': None,
-            'ellipse': None,
-            'text': None
-        }
+        self._last_motion_xy = None # ultimo pixel (x, y) tratado em on_mouse_move
+        self._decim_cache = {} # {plane: (fatia original, (step_x, step_y, area), fatia reduzida)}
+        self._roi_arrays = None # (chave das ROIs/predicoes, arrays) de _get_roi_arrays
+        self._lut_cache = {} # {(dtype, vmin, vmax): LUT uint8}; nao usado durante o arraste de W/L
         
         self.rois = []
+        self._rois_version = 0 # incrementado a cada mudanca em rois/roi_status (chave dos textos)
         self.lesion_counter = 1
         self.last_message = "Pronto"
         self.last_key = None
@@ -219,8 +350,14 @@ class ViewerApp:
         self.show_gt = False
         self.gt_lesions = []
         self.gt_threshold_mm = 10.0
+        self._gt_xyz_cache = None # (lista gt_lesions, array (N, 3) em mm)
+        self._gt_cache = {} # {case_name: (patient_id, lesions, source, stats, error)}
+        self._key_dispatch = self._build_key_dispatch()
         
         self.fig = None
+        self._export_fig = None # figura do fallback de export PNG, criada sob demanda
+        self._export_ax = None
+        self._export_fig_lock = threading.Lock() # o fallback pode rodar em mais de um worker
         self.ax_axial = None
         self.ax_sag = None
         self.ax_cor = None
@@ -240,6 +377,7 @@ class ViewerApp:
         assets_dir = path_utils.resolve_path("viewer", "assets")
         logo_path = assets_dir / "ararat_logo.png"
         self.ico_path = str(assets_dir / "ararat_logo.ico")
+        self._ico_ready = os.path.exists(self.ico_path)
         if not logo_path.exists():
             png_candidates = list(assets_dir.glob("*.png"))
             if png_candidates:
@@ -247,11 +385,14 @@ class ViewerApp:
         
         if logo_path.exists():
             try:
-                self.logo_img = mpimg.imread(str(logo_path))
-                if not os.path.exists(self.ico_path):
-                    img = Image.open(str(logo_path))
-                    img.save(self.ico_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)])
-                    print(f"[INFO] Icone gerado em {self.ico_path}")
+                logo = ViewerApp._logo_cache.get(str(logo_path))
+                if logo is None:
+                    logo = ViewerApp._logo_cache[str(logo_path)] = mpimg.imread(str(logo_path))
+                self.logo_img = logo
+                if not self._ico_ready:
+                    # o .ico so e usado no proximo launch: gera fora da thread da UI
+                    threading.Thread(target=self._ensure_ico, args=(str(logo_path),), daemon=True,
+                                     name="ararat-ico").start()
             except Exception as e:
                 print(f"[WARNING] Erro ao processar logo/icone: {e}")
                 logger.exception("falha_logo_icone")
@@ -262,6 +403,11 @@ class ViewerApp:
         self.export_dir = str(path_utils.resolve_writable_path("exports"))
         self.roi_img_dir = os.path.join(self.export_dir, "roi_images")
         os.makedirs(self.roi_img_dir, exist_ok=True)
+        self._manifest_path = os.path.join(self.export_dir, "roi_manifest.csv")
+        self._manifest_fh = None # handle do manifest aberto sob demanda e mantido na sessao
+        self._manifest_writer = None
+        atexit.register(self._close_manifest)
+        atexit.register(self._release_volumes)
 
         self.discover_workspace()
         if self.is_samples_mode:
@@ -277,6 +423,8 @@ class ViewerApp:
 
     def discover_workspace(self):
         """Detecta se input_root é uma raiz de casos ou um caso específico."""
+        # nova raiz (ou a mesma reaberta): descarta as varreduras de series anteriores
+        self._series_discovery_cache = {}
         if not self.input_root or not os.path.exists(self.input_root):
             self.cases_list = []
             self.last_message = "Dataset não encontrado. Selecione a pasta de cases."
@@ -304,15 +452,9 @@ class ViewerApp:
             self.is_samples_mode = True
         else:
             # caso b:
-            try:
-                subdirs = sorted([d for d in os.listdir(self.input_root) 
-                                 if os.path.isdir(os.path.join(self.input_root, d))])
-            except:
-                subdirs = []
-            
             has_valid_subdirs = False
-            for d in subdirs:
-                if dicom_io.list_case_series(os.path.join(self.input_root, d)):
+            for _, path in self._list_subdirs(self.input_root):
+                if dicom_io.list_case_series(path):
                     has_valid_subdirs = True
                     break
             
@@ -340,21 +482,40 @@ class ViewerApp:
         if self.is_samples_mode:
             self.discover_patients()
 
+    def _ensure_ico(self, logo_path):
+        """Gera o .ico da janela a partir da logo (roda em thread daemon)."""
+        tmp_path = self.ico_path + ".tmp"
+        try:
+            img = Image.open(logo_path)
+            img.save(tmp_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)])
+            # rename atomico: um launch concorrente nunca ve um .ico pela metade
+            os.replace(tmp_path, self.ico_path)
+            logger.info("icone_gerado=%s", self.ico_path)
+        except Exception:
+            logger.exception("falha_gerar_icone")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _list_subdirs(root):
+        """Subpastas de root como [(nome, caminho)] ordenadas por nome (scandir reaproveita o tipo do readdir)."""
+        try:
+            with os.scandir(root) as it:
+                return sorted((e.name, e.path) for e in it if e.is_dir())
+        except OSError:
+            return []
+
     def discover_patients(self):
         """Descobre pacientes na samples_root de forma estável."""
         if not self.samples_root or not os.path.exists(self.samples_root):
             return
             
-        try:
-            subdirs = sorted([d for d in os.listdir(self.samples_root) 
-                             if os.path.isdir(os.path.join(self.samples_root, d))])
-        except:
-            subdirs = []
-            
         valid_cases = []
-        for d in subdirs:
-            if dicom_io.list_case_series(os.path.join(self.samples_root, d)):
-                valid_cases.append(d)
+        for name, path in self._list_subdirs(self.samples_root):
+            if dicom_io.list_case_series(path):
+                valid_cases.append(name)
         
         if valid_cases:
             print(f"[INFO] {len(valid_cases)} casos encontrados em {self.samples_root}")
@@ -375,14 +536,21 @@ class ViewerApp:
         
         new_idx = (self.current_case_idx + delta) % len(self.cases_list)
         self.load_case(new_idx)
-        self.last_message = f"Paciente: {self.cases_list[new_idx]}"
+        if self._series_load is None: # async: mantem "Carregando ..."
+            self.last_message = f"Paciente: {self.cases_list[new_idx]}"
         if self.fig: self.update_plot()
 
     def _get_autosave_path(self, case_name):
         """Retorna o caminho do arquivo rois_latest.json para um paciente."""
         if not self.input_root:
             return None
-        return os.path.join(self.export_dir, case_name, "rois_latest.json")
+        path = self._autosave_paths.get(case_name)
+        if path is None:
+            case_dir = os.path.join(self.export_dir, case_name)
+            os.makedirs(case_dir, exist_ok=True)
+            path = os.path.join(case_dir, "rois_latest.json")
+            self._autosave_paths[case_name] = path
+        return path
 
     def _autosave_rois(self):
         """Salva as ROIs do paciente atual no arquivo rois_latest.json."""
@@ -404,23 +572,21 @@ class ViewerApp:
         path = self._get_autosave_path(case_name)
         if path and os.path.exists(path):
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    
-                loaded_rois = []
-                for r in data.get("rois", []):
-                    center_mm = r.get("center_xyz_mm")
-                    if not center_mm: continue
- 
-                    roi = {
-                        "id": r.get("id", f"L{len(loaded_rois)+1}"),
-                        "center_mm": center_mm,
+                with open(path, 'rb') as f:
+                    data = _json_loads(f.read())
+
+                entries = [r for r in data.get("rois", []) if r.get("center_xyz_mm")]
+                loaded_rois = [
+                    {
+                        "id": r.get("id") or f"L{n}",
+                        "center_mm": r["center_xyz_mm"],
                         "radius_mm": r.get("radius_mm", 5.0),
                         "series_uid": r.get("series_instance_uid", "UNKNOWN"),
-                        "center_voxel": r.get("center_ijk", [0, 0, 0]) 
+                        "center_voxel": r.get("center_ijk") or [0, 0, 0],
                     }
-                    loaded_rois.append(roi)
-                
+                    for n, r in enumerate(entries, 1)
+                ]
+
                 if loaded_rois:
                     self.rois_by_patient[case_name] = loaded_rois
                     self.last_message = "ROIs carregadas de rois_latest.json"
@@ -441,6 +607,7 @@ class ViewerApp:
             
         new_case_name = self.cases_list[case_idx]
         print(f"\n[HOT-SWAP] Trocando para caso: {new_case_name}")
+        self._get_autosave_path(new_case_name)
 
         if self.rois:
             self.last_message = "Aviso: ROIs nao exportadas. Pressione E para exportar."
@@ -473,6 +640,7 @@ class ViewerApp:
                 self.lesion_counter = 1
         
         self.roi_status = {}
+        self._rois_version += 1
         self.candidate_center = None
         self.is_locked = False
         self.mode = "NORMAL"
@@ -481,6 +649,7 @@ class ViewerApp:
         self.last_message = f"Caso {new_case_name} carregado."
         self.show_gt = False
         self.gt_lesions = []
+        self._gt_cache.pop(new_case_name, None)
 
         self.discover_series()
         self.load_current_series()
@@ -494,6 +663,11 @@ class ViewerApp:
             self.gt_lesions = []
             return
         case_name = self.cases_list[self.current_case_idx]
+        cached = self._gt_cache.get(case_name)
+        if cached is not None:
+            (self.gt_patient_id, self.gt_lesions, self.gt_label_source,
+             self.gt_labels_stats, self.gt_labels_error) = cached
+            return
         try:
             patient_id = gt_labels.resolve_patient_id(case_name, self.input_root)
         except Exception:
@@ -502,6 +676,8 @@ class ViewerApp:
         if not patient_id:
             self.gt_lesions = []
             self.last_message = f"GT indisponivel: nao foi possivel mapear {case_name}"
+            self._gt_cache[case_name] = (None, [], self.gt_label_source,
+                                         getattr(self, "gt_labels_stats", None), getattr(self, "gt_labels_error", None))
             return
         try:
             self.gt_lesions = gt_labels.get_gt_for_case(patient_id, self.input_root)
@@ -516,6 +692,8 @@ class ViewerApp:
         self.gt_label_source = (st.get("source") if isinstance(st, dict) else None) or (self.gt_lesions[0].get("source") if self.gt_lesions else None)
         self.gt_labels_stats = st.get("stats") if isinstance(st, dict) else None
         self.gt_labels_error = st.get("error") if isinstance(st, dict) else None
+        self._gt_cache[case_name] = (self.gt_patient_id, self.gt_lesions, self.gt_label_source,
+                                     self.gt_labels_stats, self.gt_labels_error)
         logger.info("gt_case_loaded case=%s patient_id=%s lesions=%s source=%s", case_name, patient_id, len(self.gt_lesions), self.gt_label_source)
 
     def discover_series(self):
@@ -525,78 +703,74 @@ class ViewerApp:
             self.series_list = []
             return
 
+        cached = self._series_discovery_cache.get(self.dicom_root)
+        if cached is not None:
+            # caso ja visitado: reaproveita a varredura e a escolha do T2 quick
+            self.series_list, t2_quick, self.current_series_idx = cached
+            self.t2_quick = dict(t2_quick)
+            logger.debug("series_cache_hit dicom_root=%s", self.dicom_root)
+            return
+
         print(f"Buscando series em: {self.dicom_root}...")
         self.series_list = dicom_io.list_case_series(self.dicom_root)
         if not self.series_list:
             print(f"\n[AVISO] Nenhuma serie DICOM valida encontrada em {self.dicom_root}")
             return
+        # nomes truncados e linha da lista de series (sidebar/HUD), formatados uma vez por caso
+        for i, s in enumerate(self.series_list, 1):
+            s['_name_12'] = s['series_name'][:12]
+            s['_name_20'] = s['series_name'][:20]
+            s['_row'] = f"[{i}] {s['_name_12']} ({s['orientation'][0].upper()})"
 
         self.t2_quick = {'axial': None, 'coronal': None, 'sagittal': None}
-        
-        print("\n[DEBUG] Analisando candidatos T2 QUICK:")
+
+        ns = np.fromiter((s['num_slices'] for s in self.series_list), dtype=np.int32, count=len(self.series_list))
+        is_t2 = np.fromiter((s['is_t2'] for s in self.series_list), dtype=bool, count=len(self.series_list))
+        orient_arr = np.array([s['orientation'] for s in self.series_list])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("t2_quick_candidatos")
+            for idx in np.flatnonzero(is_t2):
+                s = self.series_list[idx]
+                logger.debug("t2_candidato serie=%s orient=%s slices=%s", s['series_name'], s['orientation'], s['num_slices'])
 
         for orient in ['axial', 'coronal', 'sagittal']:
-            candidates = []
-            for idx, s in enumerate(self.series_list):
-                if s['is_t2']:
-                    print(f"  - Serie: {s['series_name']} | Orient: {s['orientation']} | Slices: {s['num_slices']}")
-                
-                if s['is_t2'] and s['orientation'] == orient:
-                    candidates.append((idx, s))
-            
-            if candidates:
-                best_idx = max(candidates, key=lambda x: x[1]['num_slices'])[0]
+            cand = np.flatnonzero(is_t2 & (orient_arr == orient))
+            if cand.size:
+                best_idx = int(cand[np.argmax(ns[cand])])
                 self.t2_quick[orient] = best_idx
-                print(f"  => [VITORIA] T2 {orient.upper()} detectada: {self.series_list[best_idx]['series_name']}")
+                logger.debug("t2_quick orient=%s serie=%s", orient, self.series_list[best_idx]['series_name'])
             else:
-                print(f"  => [AVISO] T2 {orient.upper()} nao encontrada")
+                logger.debug("t2_quick orient=%s nao_encontrada", orient)
 
         if self.t2_quick['axial'] is not None:
             self.current_series_idx = self.t2_quick['axial']
-            return
-
-        self.current_series_idx = self.series_list.index(max(self.series_list, key=lambda x: x['num_slices']))
+        else:
+            self.current_series_idx = int(np.argmax(ns))
+        self._series_discovery_cache[self.dicom_root] = (self.series_list, dict(self.t2_quick), self.current_series_idx)
 
     def validate_rois_for_current_series(self):
         """Valida se cada ROI confirmada esta dentro do volume atual."""
+        self._rois_version += 1
         if not self.meta or not self.rois:
             self.roi_status = {}
             return {}
 
+        # converte centros do mundo para voxel na serie atual (uma matmul para todas as ROIs)
+        centers_mm = np.array([roi['center_mm'] for roi in self.rois], dtype=np.float64)
+        vox = np.rint(self._m2v_batch(centers_mm))
+        radii = np.array([roi['radius_mm'] for roi in self.rois], dtype=np.float64)
+        rvox = radii[:, None] * self._inv_spacing
+        codes = roi_sphere.roi_bounds_status(vox, rvox, self.np_vol.shape[::-1], use_numba=self._roi_kernels_ready())
+
         new_status = {}
         out_list = []
-        
-        for roi in self.rois:
-            lid = roi['id']
-            rmm = roi['radius_mm']
-            
-            # converte centro do mundo para voxel na serie atual
-            vi, vj, vk = dicom_io.mm_to_voxel(roi['center_mm'][0], 
-                                            roi['center_mm'][1], 
-                                            roi['center_mm'][2], 
-                                            self.meta)
-            
-            sz_k, sz_j, sz_i = self.np_vol.shape
+        for roi, code in zip(self.rois, codes):
+            status = roi_sphere.ROI_STATUS_NAMES[code]
+            new_status[roi['id']] = status
+            if status == "OUT":
+                out_list.append(roi['id'])
 
-            is_center_in = (0 <= vi < sz_i and 0 <= vj < sz_j and 0 <= vk < sz_k)
-            
-            if not is_center_in:
-                status = "OUT"
-                out_list.append(lid)
-            else:
-                ri = rmm / self.meta['spacing'][0]
-                rj = rmm / self.meta['spacing'][1]
-                rk = rmm / self.meta['spacing'][2]
-                
-                is_partial = (
-                    vi - ri < 0 or vi + ri >= sz_i or
-                    vj - rj < 0 or vj + rj >= sz_j or
-                    vk - rk < 0 or vk + rk >= sz_k
-                )
-                status = "PARTIAL" if is_partial else "OK"
-            
-            new_status[lid] = status
-            
         self.roi_status = new_status
 
         if out_list:
@@ -605,10 +779,15 @@ class ViewerApp:
         return new_status
 
     def load_current_series(self, center_mm=None):
-        """Carrega os dados da serie selecionada no momento."""
+        """
+        Carrega os dados da serie selecionada no momento. Serie fora do cache e lida no
+        pool de I/O; ate ela chegar os paineis ficam vazios e a UI segue respondendo.
+        """
+        self._series_load = None # um load ainda em andamento deixa de ser aplicado
         if not self.series_list or self.current_series_idx >= len(self.series_list):
             self.sitk_img, self.np_vol, self.meta = None, None, None
-            self.sitk_img_disp, self.np_vol_disp, self.meta_disp = None, None, None
+            self.meta_disp, self._disp_key = None, None
+            self._update_affine_cache()
             self.max_slice = 0
             self.current_slice = 0
             self.center_voxel = [0, 0, 0]
@@ -620,61 +799,159 @@ class ViewerApp:
         cache_key = (case_name, s_idx)
 
         if cache_key in self._series_cache:
-            print(f"[DEBUG] Cache HIT: {cache_key}")
-            self.sitk_img, self.np_vol, self.meta = self._series_cache[cache_key]
-            self._cache_order.remove(cache_key)
-            self._cache_order.append(cache_key)
+            logger.debug("cache_hit key=%s", cache_key)
+            self.np_vol, self.meta, _ = self._series_cache[cache_key]
+            self._series_cache.move_to_end(cache_key)
+            self.sitk_img = None # montado sob demanda a partir do memmap
             self.last_message = f"Pronto (cache)"
         else:
             s = self.series_list[s_idx]
-            self.last_message = f"Carregando {s['series_name']}..."
-            if self.fig: self.update_plot()
-            
             print(f"\n[INFO] Carregando serie: {s['series_name']} ({s['orientation']})")
-            try:
-                self.sitk_img, self.np_vol, self.meta = dicom_io.load_dicom_series_by_path(
-                    s['series_dir'], s['series_uid']
-                )
-
-                self._series_cache[cache_key] = (self.sitk_img, self.np_vol, self.meta)
-                self._cache_order.append(cache_key)
-                if len(self._cache_order) > self._max_cache_size:
-                    oldest = self._cache_order.pop(0)
-                    if oldest in self._series_cache:
-                        del self._series_cache[oldest]
-                        print(f"[DEBUG] Cache Evict: {oldest}")
-                self.last_message = "Pronto"
-                    
-            except Exception as e:
-                self.last_message = f"ERRO ao carregar serie (ver terminal)"
-                print(f"\n[ERRO] Falha ao carregar serie {s['series_name']}: {e}")
-                logger.exception("erro_carregar_serie")
-                traceback.print_exc()
-                if self.fig: self.update_plot()
+            if self._prefetch is not None and self._prefetch[0] == cache_key:
+                fut = self._prefetch[1] # ja esta sendo pre-lida: so espera o mesmo job
+            else:
+                fut = self._io_pool.submit(self._run_series_load, s['series_dir'], s['series_uid'])
+            timer = self.fig.canvas.new_timer(interval=50) if self.fig else None
+            if timer is None or type(timer) is TimerBase:
+                # sem loop de eventos: espera a leitura aqui mesmo
+                if not self._apply_series_load(cache_key, s, fut):
+                    return
+            else:
+                # placeholder: paineis vazios ate o volume chegar (center_mm ja foi materializado)
+                self.sitk_img, self.np_vol, self.meta = None, None, None
+                self.meta_disp, self._disp_key = None, None
+                self._update_affine_cache()
+                # centro travado era da serie anterior; sem volume nao ha como confirmar
+                self.candidate_center = None
+                self.is_locked = False
+                self._series_load = fut
+                self.last_message = f"Carregando {s['series_name']}..."
+                timer.add_callback(self._poll_series_load, fut, timer, cache_key, s, center_mm)
+                self._io_timers.add(timer)
+                timer.start()
+                self._schedule_update()
                 return
 
+        self._finish_series_load(center_mm)
+
+    def _run_series_load(self, series_dir, series_uid):
+        """
+        Leitura da serie no pool de I/O (o reader do SimpleITK solta o GIL). O volume ja
+        sai gravado no .npy temporario; retorna (np_vol, meta, npy_path).
+        """
+        sitk_img, np_vol, meta = dicom_io.load_dicom_series_by_path(series_dir, series_uid)
+        sitk_img, np_vol = ViewerApp._compact_volume(sitk_img, np_vol)
+        del sitk_img # refeito sob demanda a partir do memmap (ver sitk_img)
+        np_vol, npy_path = self._spill_volume(np_vol)
+        return np_vol, meta, npy_path
+
+    def _poll_series_load(self, fut, timer, cache_key, s, center_mm):
+        """Callback do timer (thread da UI): aplica a serie lida quando o job termina."""
+        if not fut.done():
+            return
+        timer.stop()
+        self._io_timers.discard(timer)
+        if fut is not self._series_load:
+            # o usuario ja trocou de serie/caso: so aproveita o volume no cache
+            if fut.exception() is None:
+                self._cache_series(cache_key, *fut.result())
+            return
+        self._series_load = None
+        if self._apply_series_load(cache_key, s, fut):
+            self._finish_series_load(center_mm)
+        else:
+            self._prefetch_next() # a fila ficou parada durante o load
+
+    def _apply_series_load(self, cache_key, s, fut):
+        """Torna a serie lida a atual e guarda no cache; False (com mensagem) se a leitura falhou."""
+        try:
+            np_vol, meta, npy_path = fut.result()
+        except Exception as e:
+            self.last_message = f"ERRO ao carregar serie (ver terminal)"
+            logger.error("erro_carregar_serie serie=%s: %s", s['series_name'], e, exc_info=self._debug)
+            if self.fig: self.update_plot()
+            return False
+        self.sitk_img, self.meta = None, meta
+        self.np_vol = self._cache_series(cache_key, np_vol, meta, npy_path)
+        self.last_message = "Pronto"
+        return True
+
+    def _cache_series(self, cache_key, np_vol, meta, npy_path):
+        """Insere o volume (memmap ja gravado no worker) no cache LRU e devolve o array do cache."""
+        cached = self._series_cache.get(cache_key)
+        if cached is not None:
+            # mesma leitura ja entrou pelo prefetch; o .npy duplicado nao e usado
+            self._series_cache.move_to_end(cache_key)
+            if npy_path and npy_path != cached[2]:
+                self._remove_spill(npy_path)
+            return cached[0]
+        self._series_cache[cache_key] = (np_vol, meta, npy_path)
+        while len(self._series_cache) > self._max_cache_size:
+            oldest, (_, _, old_path) = self._series_cache.popitem(last=False)
+            logger.debug("cache_evict key=%s", oldest)
+            if old_path:
+                self._remove_spill(old_path)
+        return np_vol
+
+    def _remove_spill(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            # Windows: o mapa ainda aberto impede a remocao; nova tentativa em _release_volumes
+            self._spill_orphans.append(path)
+
+    def _release_volumes(self):
+        """
+        Fecha os memmaps do cache e apaga os .npy temporarios. Chamado ao fim de run() e
+        no atexit (idempotente); no Windows um arquivo mapeado nao pode ser removido,
+        entao todas as referencias aos volumes caem antes do rmtree.
+        """
+        for timer in list(self._io_timers):
+            try:
+                timer.stop()
+            except Exception:
+                pass # janela ja destruida
+        self._io_timers.clear()
+        self._series_cache.clear()
+        self._series_load = None
+        self._prefetch = None
+        self._prefetch_queue = []
+        self.np_vol = None
+        self.sitk_img = None
+        self._slice_cache.clear()
+        self._slice_u8_cache.clear()
+        self._decim_cache.clear()
+        gc.collect()
+        orphans, self._spill_orphans = self._spill_orphans, []
+        for path in orphans:
+            if os.path.exists(path):
+                self._remove_spill(path)
+        if self._vol_spill_dir is not None and os.path.isdir(self._vol_spill_dir):
+            try:
+                shutil.rmtree(self._vol_spill_dir)
+            except OSError as e:
+                # um worker ainda pode estar gravando; o atexit tenta de novo apos o join dos pools
+                logger.warning("spill_dir_nao_removido dir=%s erro=%s", self._vol_spill_dir, e)
+
+    def _finish_series_load(self, center_mm=None):
+        """Ajustes que dependem do volume: fatias, afim, ROIs, centro e W/L."""
         self.max_slice = self.np_vol.shape[0] - 1
+        self._slice_u8_cache.clear()
+        self._update_affine_cache()
         self._prepare_display_volume()
 
         self.validate_rois_for_current_series()
 
         for roi in self.rois:
-            v = dicom_io.mm_to_voxel(roi['center_mm'][0], roi['center_mm'][1], roi['center_mm'][2], self.meta)
+            v = self._m2v(*roi['center_mm'])
             roi['center_voxel'] = [int(round(v[0])), int(round(v[1])), int(round(v[2]))]
+        self._rois_version += 1
 
         sz_k, sz_j, sz_i = self.np_vol.shape
         if center_mm:
-            vi, vj, vk = dicom_io.mm_to_voxel(center_mm[0], center_mm[1], center_mm[2], self.meta)
-            i = int(round(max(0, min(vi, sz_i - 1))))
-            j = int(round(max(0, min(vj, sz_j - 1))))
-            k = int(round(max(0, min(vk, sz_k - 1))))
-            self._set_center_voxel(i, j, k)
+            self._set_center_voxel(*self._clip_ijk(*self._m2v(*center_mm), (sz_i, sz_j, sz_k)))
         elif self.center_mm is not None:
-            vi, vj, vk = dicom_io.mm_to_voxel(self.center_mm[0], self.center_mm[1], self.center_mm[2], self.meta)
-            i = int(round(max(0, min(vi, sz_i - 1))))
-            j = int(round(max(0, min(vj, sz_j - 1))))
-            k = int(round(max(0, min(vk, sz_k - 1))))
-            self._set_center_voxel(i, j, k)
+            self._set_center_voxel(*self._clip_ijk(*self._m2v(*self.center_mm), (sz_i, sz_j, sz_k)))
         else:
             i = sz_i // 2
             j = sz_j // 2
@@ -695,6 +972,55 @@ class ViewerApp:
         self.is_locked = False
         self.last_message = "Pronto"
         if self.fig: self.update_plot()
+        self._prefetch_t2_series()
+
+    def _prefetch_t2_series(self):
+        """
+        Pre-le em segundo plano as series T2 quick das outras orientacoes do caso, para que
+        a troca por elas saia do cache. So com loop de eventos; uma leitura por vez, em
+        executor proprio, e nenhuma comeca enquanto um load do usuario esta pendente.
+        """
+        if self.fig is None or not self.series_list:
+            return
+        case_name = self.cases_list[self.current_case_idx] if self.cases_list else "unknown"
+        self._prefetch_queue = [
+            ((case_name, idx), self.series_list[idx])
+            for idx in dict.fromkeys(self.t2_quick.values())
+            if idx is not None and idx != self.current_series_idx and (case_name, idx) not in self._series_cache
+        ]
+        self._prefetch_next()
+
+    def _prefetch_next(self):
+        if self._series_load is not None:
+            return # retomada em _poll_series_load / _finish_series_load
+        while self._prefetch is None and self._prefetch_queue:
+            cache_key, s = self._prefetch_queue.pop(0)
+            if cache_key in self._series_cache:
+                continue
+            timer = self.fig.canvas.new_timer(interval=100)
+            if type(timer) is TimerBase:
+                self._prefetch_queue = []
+                return
+            fut = self._prefetch_pool.submit(self._run_series_load, s['series_dir'], s['series_uid'])
+            self._prefetch = (cache_key, fut)
+            logger.debug("prefetch_serie key=%s", cache_key)
+            timer.add_callback(self._poll_prefetch, fut, timer, cache_key)
+            self._io_timers.add(timer)
+            timer.start()
+
+    def _poll_prefetch(self, fut, timer, cache_key):
+        """Callback do timer (thread da UI): guarda a serie pre-lida no cache e segue a fila."""
+        if not fut.done():
+            return
+        timer.stop()
+        self._io_timers.discard(timer)
+        if self._prefetch is not None and self._prefetch[1] is fut:
+            self._prefetch = None
+        if fut.exception() is None:
+            self._cache_series(cache_key, *fut.result())
+        else:
+            logger.debug("prefetch_falhou key=%s erro=%s", cache_key, fut.exception())
+        self._prefetch_next()
 
     def _set_center_voxel(self, i, j, k):
         if self.np_vol is None or self.meta is None:
@@ -707,23 +1033,67 @@ class ViewerApp:
         k = int(max(0, min(k, sz_k - 1)))
         self.center_voxel = [i, j, k]
         self.current_slice = k
-        x_mm, y_mm, z_mm = dicom_io.voxel_to_mm(i, j, k, self.meta)
-        self.center_mm = [float(x_mm), float(y_mm), float(z_mm)]
+        self._center_mm = None
+        self._center_mm_dirty = True
+
+    @staticmethod
+    def _clip_ijk(i, j, k, shape_ijk):
+        """Arredonda (i, j, k) e limita ao volume; retorna lista de int."""
+        return np.clip(np.rint((i, j, k)), 0, np.subtract(shape_ijk, 1)).astype(np.int64).tolist()
+
+    def _set_center_voxel_axis(self, axis, value):
+        """Atualiza um unico eixo de center_voxel (navegacao 2D), limitado ao volume."""
+        size = self.np_vol.shape[2 - axis]
+        self.center_voxel[axis] = int(max(0, min(value, size - 1)))
+        self.current_slice = self.center_voxel[2]
+        self._center_mm = None
+        self._center_mm_dirty = True
+
+    def _update_affine_cache(self):
+        """Monta as matrizes afins voxel <-> mm da serie atual a partir de self.meta."""
+        # materializa center_mm com a afim da serie anterior antes de troca-la
+        _ = self.center_mm
+        if self.meta is None:
+            self._M_vox2mm = None
+            self._M_mm2vox = None
+            return
+        spacing = np.asarray(self.meta["spacing"], dtype=np.float64)
+        self._sx, self._sy, self._sz = (float(v) for v in spacing)
+        self._inv_spacing = 1.0 / spacing
+        self._inv_sx, self._inv_sy, self._inv_sz = (float(v) for v in self._inv_spacing)
+        m = np.eye(4, dtype=np.float64)
+        m[:3, :3] = np.asarray(self.meta["direction"], dtype=np.float64).reshape(3, 3) * spacing
+        m[:3, 3] = self.meta["origin"]
+        self._M_vox2mm = m
+        self._M_mm2vox = np.linalg.inv(m)
+        # deslocamento em z (mm) por fatia k; a afim e linear, entao dz = dk * m[2, 2]
+        self._dz_per_k = float(m[2, 2])
+
+    def _v2m(self, i, j, k):
+        """Voxel (i, j, k) -> mm (x, y, z) usando a afim em cache."""
+        return (self._M_vox2mm @ (i, j, k, 1.0))[:3]
+
+    def _m2v(self, x, y, z):
+        """mm (x, y, z) -> voxel continuo (i, j, k) usando a afim em cache."""
+        return (self._M_mm2vox @ (x, y, z, 1.0))[:3]
+
+    def _m2v_batch(self, pts_mm):
+        """Converte um array (N, 3) de pontos em mm para voxels continuos (N, 3)."""
+        pts_mm = np.asarray(pts_mm, dtype=np.float64).reshape(-1, 3)
+        return pts_mm @ self._M_mm2vox[:3, :3].T + self._M_mm2vox[:3, 3]
 
     def _move_center_slice(self, plane, delta):
         if self.np_vol is None:
             return
-        sz_k, sz_j, sz_i = self.np_vol.shape
-        i, j, k = self.center_voxel
-        if plane == "axial":
-            k = int(max(0, min(k + delta, sz_k - 1)))
-        elif plane == "sagittal":
-            i = int(max(0, min(i + delta, sz_i - 1)))
-        elif plane == "coronal":
-            j = int(max(0, min(j + delta, sz_j - 1)))
-        self._set_center_voxel(i, j, k)
+        axis = self._PLANE_AXIS.get(plane)
+        if axis is None:
+            return
+        self._set_center_voxel_axis(axis, self.center_voxel[axis] + delta)
 
     def run(self):
+        # pyplot (backend de GUI) so e importado quando a janela vai de fato abrir
+        import matplotlib.pyplot as plt
+
         # desativa hotkeys do matplotlib
         plt.rcParams['keymap.save'] = ''
         plt.rcParams['keymap.fullscreen'] = ''
@@ -734,7 +1104,8 @@ class ViewerApp:
         plt.rcParams['keymap.zoom'] = ''
         plt.rcParams['keymap.quit'] = ''
 
-        self.fig = plt.figure(figsize=(16, 10))
+        # frameon explicito: o blit rapido do TkAgg (matplotlib >= 3.5) depende do frame opaco
+        self.fig = plt.figure(figsize=(16, 10), frameon=True)
         self.fig.patch.set_facecolor("#222222")
         self.ax_sidebar = self.fig.add_axes([0.03, 0.05, 0.22, 0.90])
         self.ax_info = self.fig.add_axes([0.80, 0.05, 0.17, 0.90])
@@ -742,6 +1113,8 @@ class ViewerApp:
         self.ax_cor = self.fig.add_axes(self.slot_bl)
         self.ax_sag = self.fig.add_axes(self.slot_br)
         self.ax = self.ax_axial
+        for ax in (self.ax_axial, self.ax_cor, self.ax_sag):
+            self._init_axes_style(ax)
 
         if self.ax_sidebar:
             self.ax_sidebar.set_facecolor("#303030")
@@ -770,7 +1143,7 @@ class ViewerApp:
 
         self.fig.canvas.manager.set_window_title("ARARAT Viewer")
 
-        if os.path.exists(self.ico_path):
+        if self._ico_ready:
             try:
                 manager = self.fig.canvas.manager
                 if hasattr(manager, 'window'):
@@ -783,6 +1156,14 @@ class ViewerApp:
             except Exception as e:
                 print(f"[WARNING] Nao foi possivel definir o icone da janela: {e}")
 
+        # TkAgg: sem a borda de foco do widget, a PhotoImage do blit fica alinhada ao canvas
+        get_tk_widget = getattr(self.fig.canvas, "get_tk_widget", None)
+        if get_tk_widget is not None:
+            try:
+                get_tk_widget().configure(highlightthickness=0)
+            except Exception:
+                logger.debug("tk_highlightthickness_falhou", exc_info=True)
+
         self._apply_slots()
         self.update_plot()
 
@@ -795,11 +1176,25 @@ class ViewerApp:
         self.fig.canvas.mpl_connect('resize_event', self.on_resize)
         
         plt.show()
+        self._close_manifest()
+        self._release_volumes()
 
     def on_draw(self, event):
-        return
+        if self.fig is None or (event is not None and event.canvas is not self.fig.canvas):
+            return
+        # fundo sem os artists animados; eles sao desenhados por cima a cada quadro
+        canvas = self.fig.canvas
+        self.background = canvas.copy_from_bbox(self.fig.bbox)
+        # fundo de cada painel MPR, para quadros que so mudam um eixo (arraste de W/L)
+        self._ax_backgrounds = {
+            ax: canvas.copy_from_bbox(ax.bbox)
+            for ax in (self.ax_axial, self.ax_cor, self.ax_sag)
+            if ax is not None
+        }
+        self._draw_animated()
 
     def on_resize(self, event):
+        self._slots_dirty = True
         self._apply_slots()
 
     def on_button_release(self, event):
@@ -808,152 +1203,197 @@ class ViewerApp:
             self._pan_drag["plane"] = None
             self._pan_drag["start_xy"] = None
             self._pan_drag["start_pan"] = None
+            self._pan_drag["mm_per_px"] = None
         if self._wl_drag["active"]:
             self._wl_drag["active"] = False
             self._wl_drag["plane"] = None
             self._wl_drag["start_xy"] = None
             self._wl_drag["base_win"] = None
             self._wl_drag["base_level"] = None
-
-    def _draw_preview_fast(self):
-        """Desenha o preview da ROI usando blitting e artists persistentes."""
-        if self.background is None or self.ax is None or self.meta is None:
-            return
-
-        self.fig.canvas.restore_region(self.background)
-
-        # determina posicao e parametros
-        if self.is_locked and self.candidate_center:
-            ci, cj, ck = self.candidate_center
-            color = 'red'
-            linestyle = '--'
-            alpha = 1.0
-        else:
-            ci, cj = self.mouse_pos
-            ck = self.current_slice
-            color = 'red'
-            linestyle = ':'
-            alpha = 0.5
-
-        # calcula intersecao da esfera
-        p_center = dicom_io.voxel_to_mm(ci, cj, ck, self.meta)
-        p_here = dicom_io.voxel_to_mm(ci, cj, self.current_slice, self.meta)
-        dz_mm = abs(p_here[2] - p_center[2])
-        
-        show_roi = dz_mm < self.radius_mm
-
-        # gerenciar crosshair
-        if self._persistent_artists['line'] is None:
-            line, = self.ax.plot([ci], [cj], marker='+', color=color, markersize=10, 
-                               animated=True, visible=False)
-            self._persistent_artists['line'] = line
-        
-        line = self._persistent_artists['line']
-        if show_roi:
-            line.set_data([ci], [cj])
-            line.set_color(color)
-            line.set_alpha(alpha)
-            line.set_visible(True)
-        else:
-            line.set_visible(False)
-
-        # gerencia elipse
-        if self._persistent_artists['ellipse'] is None:
-            ellipse = Ellipse((ci, cj), width=1, height=1, fill=False, color=color, 
-                             linewidth=2, animated=True, visible=False)
-            self.ax.add_patch(ellipse)
-            self._persistent_artists['ellipse'] = ellipse
-        
-        ellipse = self._persistent_artists['ellipse']
-        if show_roi:
-            r_slice_mm = (self.radius_mm**2 - dz_mm**2)**0.5
-            r_px_x = r_slice_mm / self.meta['spacing'][0]
-            r_px_y = r_slice_mm / self.meta['spacing'][1]
-            ellipse.set_center((ci, cj))
-            ellipse.set_width(r_px_x * 2)
-            ellipse.set_height(r_px_y * 2)
-            ellipse.set_color(color)
-            ellipse.set_linestyle(linestyle)
-            ellipse.set_alpha(alpha)
-            ellipse.set_visible(True)
-        else:
-            ellipse.set_visible(False)
-
-        # redesenhar artists
-        if line.get_visible():
-            self.ax.draw_artist(line)
-        if ellipse.get_visible():
-            self.ax.draw_artist(ellipse)
-
-        self.fig.canvas.blit(self.ax.bbox)
-
-    def _draw_roi_sphere(self, center_ijk, radius_mm, color, label=None, linestyle='-', alpha=1.0, roi_mm=None):
-        if self.meta is None:
-            return
-
-        if roi_mm:
-            ci, cj, ck = dicom_io.mm_to_voxel(roi_mm[0], roi_mm[1], roi_mm[2], self.meta)
-        else:
-            ci, cj, ck = center_ijk
-
-        p_center = dicom_io.voxel_to_mm(ci, cj, ck, self.meta)
-        p_here = dicom_io.voxel_to_mm(ci, cj, self.current_slice, self.meta)
-        dz_mm = abs(p_here[2] - p_center[2])
-        
-        if dz_mm < radius_mm:
-            r_slice_mm = (radius_mm**2 - dz_mm**2)**0.5
-            r_px_x = r_slice_mm / self.meta['spacing'][0]
-            r_px_y = r_slice_mm / self.meta['spacing'][1]
-            self.ax.plot(ci, cj, marker='+', color=color, markersize=10, alpha=alpha)
-            ellipse = Ellipse((ci, cj), width=r_px_x*2, height=r_px_y*2, 
-                             fill=False, color=color, linestyle=linestyle, alpha=alpha, linewidth=2)
-            self.ax.add_patch(ellipse)
-            if label:
-                self.ax.text(ci+2, cj+2, label, color=color, fontweight='bold', fontsize=8)
+            self._wl_pending_plane = None # o update completo abaixo ja usa o W/L final
+            # volta para a LUT e atualiza o HUD com o W/L final
+            self._schedule_update()
+
+    @staticmethod
+    def _compact_volume(sitk_img, np_vol):
+        """
+        Series com rescale inteiro costumam chegar como float; guarda em int16 C-contiguo
+        quando nao ha perda, o que reduz a memoria e habilita a LUT de W/L.
+        """
+        if np_vol.dtype.kind == "f" and np_vol.size:
+            if np_vol.min() >= -32768 and np_vol.max() <= 32767 and not np.any(np.mod(np_vol, 1.0)):
+                vol16 = np_vol.astype(np.int16)
+                img16 = sitk.GetImageFromArray(vol16)
+                img16.CopyInformation(sitk_img)
+                return img16, vol16
+        return sitk_img, np.ascontiguousarray(np_vol)
+
+    def _spill_volume(self, np_vol):
+        """
+        Grava o volume num .npy temporario e devolve (memmap read-only, caminho).
+        Se a gravacao falhar, segue com o array em memoria e caminho None. Roda nos
+        workers de I/O, nunca na thread da UI.
+        """
+        try:
+            with self._vol_spill_lock:
+                if self._vol_spill_dir is None:
+                    self._vol_spill_dir = tempfile.mkdtemp(prefix="ararat-vol-")
+                self._vol_spill_seq += 1
+                path = os.path.join(self._vol_spill_dir, f"vol_{self._vol_spill_seq}.npy")
+            np.save(path, np_vol)
+            return np.load(path, mmap_mode='r'), path
+        except Exception as e:
+            logger.warning("spill_volume_falhou erro=%s", e)
+            return np_vol, None
+
+    @staticmethod
+    def _image_from_volume(np_vol, meta):
+        """Reconstroi o sitk.Image da serie a partir do volume em cache e da geometria."""
+        img = sitk.GetImageFromArray(np.asarray(np_vol))
+        img.SetOrigin(meta["origin"])
+        img.SetSpacing(meta["spacing"])
+        img.SetDirection(meta["direction"])
+        return img
 
     def _prepare_display_volume(self):
-        self.sitk_img_disp = None
-        self.np_vol_disp = None
+        """
+        Define a grade isotropica de exibicao da serie atual. Nenhum voxel e reamostrado
+        aqui; as fatias sao geradas sob demanda em _get_display_slice.
+        """
         self.meta_disp = None
-        if self.sitk_img is None or self.np_vol is None or self.meta is None:
+        self._disp_key = None
+        self._M_mm2disp = None
+        if self.np_vol is None or self.meta is None:
             return
-        try:
-            sx, sy, sz = self.meta["spacing"]
-        except Exception:
-            sx, sy, sz = self.sitk_img.GetSpacing()
+        # so geometria: meta + shape, sem montar o sitk.Image
+        sx, sy, sz = self.meta["spacing"]
         s_min = min(float(sx), float(sy), float(sz))
         target_spacing = (s_min, s_min, s_min)
-        size_x, size_y, size_z = self.sitk_img.GetSize()
-        new_size = [
+        size_z, size_y, size_x = self.np_vol.shape
+        new_size = (
             int(round(size_x * sx / target_spacing[0])),
             int(round(size_y * sy / target_spacing[1])),
             int(round(size_z * sz / target_spacing[2])),
-        ]
-        resampled = sitk.Resample(
-            self.sitk_img,
-            new_size,
-            sitk.Transform(),
-            sitk.sitkBSpline,
-            self.sitk_img.GetOrigin(),
-            target_spacing,
-            self.sitk_img.GetDirection(),
-            0.0,
-            self.sitk_img.GetPixelID(),
         )
-        self.sitk_img_disp = resampled
-        self.np_vol_disp = sitk.GetArrayFromImage(resampled)
         self.meta_disp = {
-            "origin": resampled.GetOrigin(),
-            "spacing": resampled.GetSpacing(),
-            "direction": resampled.GetDirection(),
-            "size": resampled.GetSize(),
+            "origin": tuple(self.meta["origin"]),
+            "spacing": target_spacing,
+            "direction": tuple(self.meta["direction"]),
+            "size": new_size,
         }
+        series_uid = None
+        if self.series_list and self.current_series_idx < len(self.series_list):
+            series_uid = self.series_list[self.current_series_idx].get("series_uid")
+        if not series_uid or series_uid == "UNKNOWN":
+            case_name = self.cases_list[self.current_case_idx] if self.cases_list else "unknown"
+            series_uid = (case_name, self.current_series_idx)
+        self._disp_key = (series_uid, target_spacing, self.display_interp)
+        m = np.eye(4, dtype=np.float64)
+        m[:3, :3] = np.asarray(self.meta_disp["direction"], dtype=np.float64).reshape(3, 3) * s_min
+        m[:3, 3] = self.meta_disp["origin"]
+        self._M_mm2disp = np.linalg.inv(m)
+
+    def _get_display_slice(self, plane, idx):
+        """
+        Reamostra so a fatia pedida da grade de exibicao a partir do sitk_img original.
+
+        Returns:
+            np.ndarray 2D: axial (j, i), sagital (k, j), coronal (k, i)
+        """
+        key = (self._disp_key, plane, idx)
+        cached = self._slice_cache.get(key)
+        if cached is not None:
+            self._slice_cache.move_to_end(key)
+            return cached
+        meta_d = self.meta_disp
+        nx, ny, nz = meta_d["size"]
+        s = meta_d["spacing"][0]
+        if mpr_slice.NUMBA_AVAILABLE and self._mpr_kernel_ready():
+            # passo da grade de exibicao em voxels da serie original (mesma origem e direcao)
+            step_i, step_j, step_k = s * self._inv_sx, s * self._inv_sy, s * self._inv_sz
+            if plane == "axial":
+                p0, du, dv, nu, nv = (0.0, 0.0, idx * step_k), (step_i, 0.0, 0.0), (0.0, step_j, 0.0), nx, ny
+            elif plane == "sagittal":
+                p0, du, dv, nu, nv = (idx * step_i, 0.0, 0.0), (0.0, step_j, 0.0), (0.0, 0.0, step_k), ny, nz
+            else:
+                p0, du, dv, nu, nv = (0.0, idx * step_j, 0.0), (step_i, 0.0, 0.0), (0.0, 0.0, step_k), nx, nz
+            out = mpr_slice.sample_plane(self.np_vol, p0, du, dv, nu, nv)
+        else:
+            out = self._resample_display_slice(plane, idx)
+        self._slice_cache[key] = out
+        if len(self._slice_cache) > self._max_slice_cache_size:
+            self._slice_cache.popitem(last=False)
+        return out
+
+    def _mpr_kernel_ready(self):
+        """
+        True se o kernel numba ja esta compilado para o dtype/layout do volume atual. Na
+        primeira vez dispara a compilacao no executor de pre-leitura; ate ela terminar as
+        fatias saem por _resample_display_slice.
+        """
+        readonly = not self.np_vol.flags.writeable
+        key = (self.np_vol.dtype.str, readonly)
+        fut = self._mpr_warmup.get(key)
+        if fut is None:
+            fut = self._prefetch_pool.submit(mpr_slice.warmup, self.np_vol.dtype, readonly)
+            self._mpr_warmup[key] = fut
+        return fut.done() and fut.result()
+
+    def _roi_kernels_ready(self):
+        """Como _mpr_kernel_ready, para os kernels de roi_sphere (tipos fixos, uma compilacao)."""
+        if self._roi_warmup is None:
+            self._roi_warmup = self._prefetch_pool.submit(roi_sphere.warmup)
+        return self._roi_warmup.done() and self._roi_warmup.result()
+
+    def _resample_display_slice(self, plane, idx):
+        """Fatia da grade de exibicao via SimpleITK (sem numba ou com o kernel ainda compilando)."""
+        meta_d = self.meta_disp
+        nx, ny, nz = meta_d["size"]
+        s = meta_d["spacing"][0]
+        if plane == "axial":
+            size, offset = (nx, ny, 1), (0.0, 0.0, idx * s)
+        elif plane == "sagittal":
+            size, offset = (1, ny, nz), (idx * s, 0.0, 0.0)
+        else:
+            size, offset = (nx, 1, nz), (0.0, idx * s, 0.0)
+        d = np.asarray(meta_d["direction"], dtype=np.float64).reshape(3, 3)
+        origin = np.asarray(meta_d["origin"], dtype=np.float64) + d @ np.asarray(offset)
+        resampler = sitk.ResampleImageFilter()
+        resampler.SetSize(size)
+        resampler.SetOutputOrigin(origin.tolist())
+        resampler.SetOutputSpacing(meta_d["spacing"])
+        resampler.SetOutputDirection(meta_d["direction"])
+        resampler.SetInterpolator(self.display_interp)
+        resampler.SetDefaultPixelValue(0.0)
+        resampler.SetOutputPixelType(self.sitk_img.GetPixelID())
+        arr = sitk.GetArrayFromImage(resampler.Execute(self.sitk_img))
+        if plane == "axial":
+            return arr[0]
+        if plane == "sagittal":
+            return np.ascontiguousarray(arr[:, :, 0])
+        return np.ascontiguousarray(arr[:, 0, :])
 
     def _get_wl_for_plane(self, plane):
         w = self.win.get(plane)
         l = self.level.get(plane)
         return w, l
 
+    def _get_slice_u8(self, k):
+        """Fatia axial k normalizada para uint8 (min/max), com LRU pequeno."""
+        cached = self._slice_u8_cache.get(k)
+        if cached is not None:
+            self._slice_u8_cache.move_to_end(k)
+            return cached
+        img = self.np_vol[k, :, :]
+        lo = float(img.min())
+        hi = float(img.max())
+        scale = 255.0 / (hi - lo) if hi > lo else 0.0
+        out = ((img - np.float32(lo)) * np.float32(scale)).clip(0, 255).astype(np.uint8)
+        self._slice_u8_cache[k] = out
+        if len(self._slice_u8_cache) > self._max_slice_u8_size:
+            self._slice_u8_cache.popitem(last=False)
+        return out
+
     def _reset_wl_for_plane(self, plane, use_full_volume=False):
         if self.np_vol is None:
             self.win[plane] = None
@@ -961,25 +1401,25 @@ class ViewerApp:
             return
         vol = self.np_vol
         if not use_full_volume:
-            sz_k, sz_j, sz_i = vol.shape
-            i, j, k = self.center_voxel
-            i = int(max(0, min(i, sz_i - 1)))
-            j = int(max(0, min(j, sz_j - 1)))
-            k = int(max(0, min(k, sz_k - 1)))
+            i, j, k = self._clip_ijk(*self.center_voxel, vol.shape[::-1])
             if plane == "axial":
                 slice_img = vol[k, :, :]
             elif plane == "sagittal":
                 slice_img = vol[:, :, i]
             else:
                 slice_img = vol[:, j, :]
-            data = slice_img.astype(float).ravel()
+            data = slice_img.ravel()
         else:
-            data = vol.astype(float).ravel()
-        if data.size == 0:
+            # subamostra: os percentis do volume nao mudam de forma relevante
+            data = vol.reshape(-1)[::17]
+        n = data.size
+        if n == 0:
             self.win[plane] = None
             self.level[plane] = None
             return
-        p1, p99 = np.percentile(data, [2, 98])
+        # selecao O(n) dos dois percentis, sem copia float nem sort completo
+        lo, hi = int(0.02 * (n - 1)), int(0.98 * (n - 1))
+        p1, p99 = (float(v) for v in np.partition(data, (lo, hi))[[lo, hi]])
         w = float(max(p99 - p1, 1e-3))
         l = float((p99 + p1) * 0.5)
         self.win[plane] = w
@@ -1032,43 +1472,106 @@ class ViewerApp:
         ]
         return "\n".join(lines)
 
-    def _render_mpr_view(self, ax, plane):
-        if ax is None or self.meta is None or self.np_vol is None:
+    @staticmethod
+    def _init_axes_style(ax):
+        """Estilo fixo de um painel MPR, aplicado uma vez na criacao do eixo."""
+        ax.set_facecolor("black")
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_autoscale_on(False)
+        ax.set_aspect("equal", adjustable="datalim")
+        ax.set_anchor("C")
+        for sp in ax.spines.values():
+            sp.set_visible(True)
+
+    def _render_mpr_full(self, ax, plane):
+        """Recria os artists persistentes de um painel MPR (troca de serie, layout ou resize)."""
+        if ax is None:
+            return
+        # remove so o conteudo; estilo, aspecto e posicao do eixo ficam (ver _init_axes_style)
+        for artist in (*ax.images, *ax.lines, *ax.collections, *ax.patches, *ax.texts):
+            artist.remove()
+        ax.relim()
+        self._im_artists[plane] = None
+        self._plane_artists[plane] = None
+        if self.meta is None or self.np_vol is None:
+            return
+        self._im_artists[plane] = ax.imshow(
+            np.zeros((1, 1)),
+            extent=(0.0, 1.0, 1.0, 0.0),
+            cmap="gray",
+            origin="upper",
+            interpolation=self.interp_mode,
+            animated=True,
+        )
+        line_kw = dict(color="yellow", linestyle="--", linewidth=0.8, alpha=0.45, animated=True)
+        label_kw = dict(transform=ax.transAxes, color="#dddddd", fontsize=10, alpha=0.7, family="monospace", animated=True)
+        self._plane_artists[plane] = {
+            "vline": ax.axvline(0.0, **line_kw),
+            "hline": ax.axhline(0.0, **line_kw),
+            "orient": (
+                ax.text(0.02, 0.50, "", ha="left", va="center", **label_kw),
+                ax.text(0.98, 0.50, "", ha="right", va="center", **label_kw),
+                ax.text(0.50, 0.98, "", ha="center", va="top", **label_kw),
+                ax.text(0.50, 0.02, "", ha="center", va="bottom", **label_kw),
+            ),
+            "orient_fallback": ax.text(0.98, 0.02, "ORIENT FALLBACK", transform=ax.transAxes, color="cyan", fontsize=7,
+                                       alpha=0.7, ha="right", va="bottom", family="monospace", animated=True, visible=False),
+            "roi_ellipses": ax.add_collection(
+                EllipseCollection([], [], [], units="xy", offsets=np.empty((0, 2)), offset_transform=ax.transData,
+                                  facecolors="none", linewidths=1.5, alpha=0.8, animated=True),
+                autolim=False,
+            ),
+            "roi_markers": ax.add_collection(self._marker_collection(ax, "+", alpha=0.8), autolim=False),
+            "gt_markers": ax.add_collection(self._marker_collection(ax, "x"), autolim=False),
+            "labels": [],
+            "n_labels": 0,
+        }
+        self._render_mpr_fast(ax, plane)
+        self._draw_orientation_labels(ax, plane)
+        if self.dev_layout_debug:
+            self._draw_layout_debug(ax, plane)
+
+    def _render_mpr_fast(self, ax, plane):
+        """Atualiza os artists persistentes do painel (fatia, W/L, limites, overlays) sem recria-los."""
+        im = self._im_artists.get(plane)
+        arts = self._plane_artists.get(plane)
+        if ax is None or im is None or arts is None or self.meta is None or self.np_vol is None:
             return
-        vol = self.np_vol_disp if self.np_vol_disp is not None else self.np_vol
-        meta_d = self.meta_disp if self.meta_disp is not None else self.meta
-        sz_k, sz_j, sz_i = vol.shape
+        use_disp = self.meta_disp is not None
+        meta_d = self.meta_disp if use_disp else self.meta
+        if use_disp:
+            sz_i, sz_j, sz_k = meta_d["size"]
+        else:
+            sz_k, sz_j, sz_i = self.np_vol.shape
         try:
             sx, sy, sz = meta_d["spacing"]
         except Exception:
             sx, sy, sz = (1.0, 1.0, 1.0)
         if self.center_mm is not None:
             cx_mm, cy_mm, cz_mm = self.center_mm
-            vi, vj, vk = dicom_io.mm_to_voxel(cx_mm, cy_mm, cz_mm, meta_d)
         else:
-            i0, j0, k0 = self.center_voxel
-            vx_mm, vy_mm, vz_mm = dicom_io.voxel_to_mm(i0, j0, k0, meta_d)
-            vi, vj, vk = dicom_io.mm_to_voxel(vx_mm, vy_mm, vz_mm, meta_d)
-        vi_i = int(max(0, min(round(vi), sz_i - 1)))
-        vj_j = int(max(0, min(round(vj), sz_j - 1)))
-        vk_k = int(max(0, min(round(vk), sz_k - 1)))
+            cx_mm, cy_mm, cz_mm = self._v2m(*self.center_voxel)
+        m2v = self._M_mm2disp if use_disp else self._M_mm2vox
+        vi, vj, vk = (m2v @ (cx_mm, cy_mm, cz_mm, 1.0))[:3]
+        vi_i, vj_j, vk_k = self._clip_ijk(vi, vj, vk, (sz_i, sz_j, sz_k))
         if plane == "axial":
-            slice_index = vk_k
-            slice_img = vol[slice_index, :, :]
+            slice_img = self._get_display_slice(plane, vk_k) if use_disp else self.np_vol[vk_k, :, :]
+            slice_pos_mm, slice_step_mm = vk_k * sz, sz
             max_x = sz_i * sx
             max_y = sz_j * sy
             center_x = cx_mm
             center_y = cy_mm
         elif plane == "sagittal":
-            slice_index = vi_i
-            slice_img = vol[:, :, slice_index]
+            slice_img = self._get_display_slice(plane, vi_i) if use_disp else self.np_vol[:, :, vi_i]
+            slice_pos_mm, slice_step_mm = vi_i * sx, sx
             max_x = sz_j * sy
             max_y = sz_k * sz
             center_x = cy_mm
             center_y = cz_mm
         elif plane == "coronal":
-            slice_index = vj_j
-            slice_img = vol[:, slice_index, :]
+            slice_img = self._get_display_slice(plane, vj_j) if use_disp else self.np_vol[:, vj_j, :]
+            slice_pos_mm, slice_step_mm = vj_j * sy, sy
             max_x = sz_i * sx
             max_y = sz_k * sz
             center_x = cx_mm
@@ -1106,17 +1609,8 @@ class ViewerApp:
             vmax = level + win / 2.0
         else:
             vmin, vmax = None, None
-        extent = [0.0, max_x, max_y, 0.0]
-        ax.imshow(
-            slice_img,
-            cmap="gray",
-            origin="upper",
-            extent=extent,
-            interpolation=self.interp_mode,
-            vmin=vmin,
-            vmax=vmax,
-        )
-        ax.set_autoscale_on(False)
+        # extent antes dos limites: apply_aspect (adjustable="datalim") usa o dataLim da imagem
+        im.set_extent([0.0, max_x, max_y, 0.0])
         if state is None:
             mode = "FULL"
             xlim, ylim = (0.0, max_x), (max_y, 0.0)
@@ -1146,13 +1640,131 @@ class ViewerApp:
             else:
                 ax.set_xlim(xlim[0], xlim[1])
             ax.set_ylim(ylim[0], ylim[1])
-        ax.set_aspect("equal", adjustable="datalim")
-        ax.set_anchor("C")
-        ax.set_xticks([])
-        ax.set_yticks([])
-        for sp in ax.spines.values():
-            sp.set_visible(True)
-        if self.dev_layout_debug and state is not None:
+        ax.apply_aspect()
+        img = self._decimate_for_axes(ax, plane, slice_img, max_x, max_y)
+        im.set_interpolation(self.interp_mode)
+        # scroll num plano nao muda os pixels dos outros dois paineis: a fatia (cacheada) e o
+        # mesmo objeto, entao so refaz o W/L quando a fatia ou a janela mudam
+        px_key = (vmin, vmax, self._wl_drag["active"])
+        if img is not arts.get("raw") or px_key != arts.get("px_key"):
+            arts["px_key"] = px_key
+            img_u8 = None
+            if vmin is not None and not self._wl_drag["active"]:
+                lut = self._wl_lut(img.dtype, vmin, vmax)
+                if lut is not None:
+                    img_u8 = lut[img.view(np.uint16)]
+                elif img.dtype.kind == "f":
+                    # float (rescale nao inteiro ou fatia decimada): W/L direto para uint8 numa passada
+                    scale = np.float32(255.0 / max(float(vmax) - float(vmin), 1e-6))
+                    img_u8 = ((img - np.float32(vmin)) * scale).clip(0, 255).astype(np.uint8)
+            arts["raw"] = img
+            arts["lut_applied"] = img_u8 is not None
+            if img_u8 is not None:
+                # W/L ja aplicado; o imshow so recebe uint8 e o norm fixo nao muda entre fatias
+                if im.norm is not self._norm_u8:
+                    im.set_norm(self._norm_u8)
+                im.set_array(img_u8)
+            else:
+                self._own_norm(im)
+                im.set_array(img)
+                if vmin is not None:
+                    im.set_clim(vmin, vmax)
+                else:
+                    im.autoscale()
+        self._draw_crosshair(ax, plane)
+        arts["n_labels"] = 0
+        self._draw_rois_on_plane(ax, plane, slice_pos_mm)
+        self._draw_gt_on_plane(ax, plane, slice_pos_mm, slice_step_mm)
+        for label in arts["labels"][arts["n_labels"]:]:
+            label.set_visible(False)
+
+    def _decimate_for_axes(self, ax, plane, slice_img, max_x, max_y):
+        """
+        Reduz a fatia quando ha mais de 2 pixels de dado por pixel de tela na regiao visivel.
+        O extent em mm nao muda; o erro na borda fica abaixo de um pixel de tela.
+        """
+        rows, cols = slice_img.shape
+        w_px, h_px = self._get_axes_px(ax)
+        step_x = step_y = 1
+        if w_px and h_px:
+            vis_x = abs(np.diff(ax.get_xlim())[0]) / max_x * cols
+            vis_y = abs(np.diff(ax.get_ylim())[0]) / max_y * rows
+            step_x = max(1, int(vis_x // (2 * w_px)))
+            step_y = max(1, int(vis_y // (2 * h_px)))
+        if step_x == 1 and step_y == 1:
+            return slice_img
+        area = self.interp_mode != "nearest"
+        cached = self._decim_cache.get(plane)
+        if cached is not None and cached[0] is slice_img and cached[1] == (step_x, step_y, area):
+            img = cached[2]
+        elif area:
+            # media por bloco (equivalente a INTER_AREA), com borda replicada ate multiplo do passo
+            pad_y, pad_x = -rows % step_y, -cols % step_x
+            padded = np.pad(slice_img, ((0, pad_y), (0, pad_x)), mode="edge")
+            img = padded.reshape(padded.shape[0] // step_y, step_y, padded.shape[1] // step_x, step_x).mean(
+                axis=(1, 3), dtype=np.float32
+            )
+        else:
+            img = slice_img[::step_y, ::step_x]
+        self._decim_cache[plane] = (slice_img, (step_x, step_y, area), img)
+        return img
+
+    def _wl_lut(self, dtype, vmin, vmax):
+        """
+        LUT uint8 de 65536 entradas para W/L em fatias int16/uint16, indexada pela
+        representacao uint16 do dado. Retorna None para outros dtypes.
+        """
+        if dtype not in (np.int16, np.uint16):
+            return None
+        key = (np.dtype(dtype).str, float(vmin), float(vmax))
+        lut = self._lut_cache.get(key)
+        if lut is None:
+            values = np.arange(65536, dtype=np.uint16).view(dtype).astype(np.float32)
+            scale = 255.0 / max(float(vmax) - float(vmin), 1e-6)
+            lut = np.clip((values - float(vmin)) * scale, 0, 255).astype(np.uint8)
+            if len(self._lut_cache) >= 8:
+                self._lut_cache.clear()
+            self._lut_cache[key] = lut
+        return lut
+
+    @staticmethod
+    def _marker_collection(ax, marker, **kwargs):
+        """PathCollection de marcadores em pixels (como scatter), sem mexer no dataLim."""
+        style = MarkerStyle(marker)
+        path = style.get_path().transformed(style.get_transform())
+        return PathCollection(
+            (path,),
+            sizes=[64.0],
+            offsets=np.empty((0, 2)),
+            offset_transform=ax.transData,
+            facecolors="none",
+            linewidths=1.0,
+            animated=True,
+            **kwargs,
+        )
+
+    def _overlay_label(self, ax, arts, x, y, text, color, fontweight="normal"):
+        """Reaproveita o pool de Text do painel para rotulos de ROI/GT."""
+        n = arts["n_labels"]
+        if n == len(arts["labels"]):
+            arts["labels"].append(ax.text(0.0, 0.0, "", fontsize=7, animated=True))
+        label = arts["labels"][n]
+        label.set_position((x, y))
+        label.set_text(text)
+        label.set_color(color)
+        label.set_fontweight(fontweight)
+        label.set_visible(True)
+        arts["n_labels"] = n + 1
+
+    @staticmethod
+    def _set_overlay_offsets(coll, xs, ys, colors):
+        coll.set_offsets(np.column_stack((xs, ys)) if len(xs) else np.empty((0, 2)))
+        coll.set_edgecolors(colors if len(colors) else "none")
+
+    def _draw_layout_debug(self, ax, plane):
+        """Textos de depuracao de layout (modo DEV), animados para ficarem acima da imagem."""
+        state = self.view_state.get(plane)
+        if state is not None:
             bbox = ax.get_window_extent().bounds if self.fig and self.fig.canvas else (0.0, 0.0, 0.0, 0.0)
             xlim_now = ax.get_xlim()
             ylim_now = ax.get_ylim()
@@ -1162,25 +1774,22 @@ class ViewerApp:
                 f"ylim={ylim_now[0]:.1f},{ylim_now[1]:.1f}\n"
                 f"mode={state.get('mode','')}"
             )
-            ax.text(
+            self._text_artist(
+                f"debug_{plane}",
+                ax,
                 0.02,
                 0.02,
-                dbg,
-                transform=ax.transAxes,
                 fontsize=6,
                 color="cyan",
                 verticalalignment="bottom",
                 family="monospace",
-            )
+            ).set_text(dbg)
             last = self._last_view_limits.get(plane)
             cur = (round(xlim_now[0], 3), round(xlim_now[1], 3), round(ylim_now[0], 3), round(ylim_now[1], 3))
             if last != cur:
                 print(f"[VIEW] {plane} xlim={xlim_now} ylim={ylim_now} mode={state.get('mode')}")
                 self._last_view_limits[plane] = cur
-        self._draw_crosshair(ax, plane)
-        self._draw_rois_on_plane(ax, plane, slice_index)
-        self._draw_gt_on_plane(ax, plane, slice_index)
-        if self.fig and self.dev_layout_debug:
+        if self.fig:
             w_px, h_px = self._get_axes_px(ax)
             if w_px and h_px:
                 if ax is self.ax_axial:
@@ -1193,45 +1802,21 @@ class ViewerApp:
                     slot_name = ""
                 if slot_name:
                     txt = f"{slot_name} {w_px}x{h_px}"
-                    ax.text(
+                    self._text_artist(
+                        f"slot_{plane}",
+                        ax,
                         0.02,
                         0.90,
-                        txt,
-                        transform=ax.transAxes,
                         fontsize=8,
                         color="#bbbbbb",
                         verticalalignment="top",
                         horizontalalignment="left",
                         family="monospace",
                         alpha=0.9,
-                    )
-        self._draw_orientation_labels(ax, plane)
-        if ax is self.ax_axial:
-            ax.set_position(self.slot_main)
-        elif ax is self.ax_cor:
-            ax.set_position(self.slot_bl)
-        elif ax is self.ax_sag:
-            ax.set_position(self.slot_br)
+                    ).set_text(txt)
 
     def _get_layout_assignment(self):
-        mv = self.main_view or "axial"
-        if mv == "coronal":
-            return {
-                "main": "coronal",
-                "bottom_left": "axial",
-                "bottom_right": "sagittal",
-            }
-        if mv == "sagittal":
-            return {
-                "main": "sagittal",
-                "bottom_left": "axial",
-                "bottom_right": "coronal",
-            }
-        return {
-            "main": "axial",
-            "bottom_left": "coronal",
-            "bottom_right": "sagittal",
-        }
+        return self._LAYOUTS.get(self.main_view, self._LAYOUTS["axial"])
 
     def _plane_for_axes(self, ax):
         if ax is None:
@@ -1256,6 +1841,7 @@ class ViewerApp:
             self.ax_cor.set_position(self.slot_bl)
         if self.ax_sag:
             self.ax_sag.set_position(self.slot_br)
+        self._slots_dirty = False
 
     def _toggle_maximize_panel(self, plane):
         if plane not in ["axial", "coronal", "sagittal"]:
@@ -1284,7 +1870,8 @@ class ViewerApp:
     
     def _draw_orientation_labels(self, ax, plane):
         meta = self.meta_disp if self.meta_disp is not None else self.meta
-        if meta is None or ax is None:
+        arts = self._plane_artists.get(plane)
+        if meta is None or ax is None or arts is None:
             return
         try:
             direction = meta.get("direction")
@@ -1339,12 +1926,9 @@ class ViewerApp:
                 return
         if plane in ["axial", "coronal"] and self.plane_flip_x.get(plane):
             left_label, right_label = right_label, left_label
-        ax.text(0.02, 0.50, left_label, transform=ax.transAxes, color="#dddddd", fontsize=10, alpha=0.7, ha="left", va="center", family="monospace")
-        ax.text(0.98, 0.50, right_label, transform=ax.transAxes, color="#dddddd", fontsize=10, alpha=0.7, ha="right", va="center", family="monospace")
-        ax.text(0.50, 0.98, top_label, transform=ax.transAxes, color="#dddddd", fontsize=10, alpha=0.7, ha="center", va="top", family="monospace")
-        ax.text(0.50, 0.02, bottom_label, transform=ax.transAxes, color="#dddddd", fontsize=10, alpha=0.7, ha="center", va="bottom", family="monospace")
-        if use_fallback and self.dev_layout_debug:
-            ax.text(0.98, 0.02, "ORIENT FALLBACK", transform=ax.transAxes, color="cyan", fontsize=7, alpha=0.7, ha="right", va="bottom", family="monospace")
+        for artist, text in zip(arts["orient"], (left_label, right_label, top_label, bottom_label)):
+            artist.set_text(text)
+        arts["orient_fallback"].set_visible(use_fallback and self.dev_layout_debug)
 
     def _debug_slot_sizes(self):
         if not self.fig:
@@ -1378,33 +1962,33 @@ class ViewerApp:
         label = name
         if self.np_vol is not None:
             sz_k, sz_j, sz_i = self.np_vol.shape
-            i, j, k = self.center_voxel
+            i, j, k = self._clip_ijk(*self.center_voxel, (sz_i, sz_j, sz_k))
             if plane == "axial":
-                pos = int(max(0, min(k, sz_k - 1))) + 1
-                total = sz_k
-                label = f"{name} k={pos}/{total}"
+                label = f"{name} k={k + 1}/{sz_k}"
             elif plane == "coronal":
-                pos = int(max(0, min(j, sz_j - 1))) + 1
-                total = sz_j
-                label = f"{name} j={pos}/{total}"
+                label = f"{name} j={j + 1}/{sz_j}"
             else:
-                pos = int(max(0, min(i, sz_i - 1))) + 1
-                total = sz_i
-                label = f"{name} i={pos}/{total}"
+                label = f"{name} i={i + 1}/{sz_i}"
         else:
             label = f"{name} [NO DATA]"
-        ax.text(
-            0.02,
-            0.98,
-            label,
-            transform=ax.transAxes,
-            fontsize=10,
-            color=title_color,
-            fontfamily="monospace",
-            bbox=dict(facecolor=base_color, alpha=0.9, edgecolor="none", boxstyle="round,pad=0.3"),
-            verticalalignment="top",
-            horizontalalignment="left",
-        )
+        title = self._panel_titles.get(plane)
+        if title is None or title.axes is not ax:
+            title = ax.text(
+                0.02,
+                0.98,
+                "",
+                transform=ax.transAxes,
+                fontsize=10,
+                fontfamily="monospace",
+                bbox=dict(alpha=0.9, edgecolor="none", boxstyle="round,pad=0.3"),
+                verticalalignment="top",
+                horizontalalignment="left",
+                animated=True,
+            )
+            self._panel_titles[plane] = title
+        title.set_text(label)
+        title.set_color(title_color)
+        title.get_bbox_patch().set_facecolor(base_color)
         for side, sp in ax.spines.items():
             sp.set_linewidth(1.5 if is_active else 1.0)
             if side == "top":
@@ -1413,16 +1997,11 @@ class ViewerApp:
                 sp.set_edgecolor("yellow" if is_active else "#444")
 
     def _draw_crosshair(self, ax, plane):
-        if self.np_vol is None or self.meta is None:
+        arts = self._plane_artists.get(plane)
+        if self.np_vol is None or self.meta is None or arts is None:
             return
         i, j, k = self.center_voxel
-        try:
-            sx, sy, sz = self.meta["spacing"]
-        except Exception:
-            try:
-                sx, sy, sz = self.sitk_img.GetSpacing()
-            except Exception:
-                sx, sy, sz = (1.0, 1.0, 1.0)
+        sx, sy, sz = self._sx, self._sy, self._sz
         if plane == "axial":
             x = i * sx
             y = j * sy
@@ -1434,8 +2013,8 @@ class ViewerApp:
             y = k * sz
         else:
             return
-        ax.axvline(x, color="yellow", linestyle="--", linewidth=0.8, alpha=0.45)
-        ax.axhline(y, color="yellow", linestyle="--", linewidth=0.8, alpha=0.45)
+        arts["vline"].set_xdata([x, x])
+        arts["hline"].set_ydata([y, y])
 
     def _get_roi_draw_params(self, roi):
         color = "lime"
@@ -1455,91 +2034,73 @@ class ViewerApp:
             text_label = f"{roi['id']} {perc:.0f}% {cat}"
         return color, text_label
 
-    def _draw_rois_on_plane(self, ax, plane, slice_index):
+    def _draw_rois_on_plane(self, ax, plane, slice_pos_mm):
         if self.np_vol is None or self.meta is None:
             return
-        if not self.rois:
+        arts = self._plane_artists.get(plane)
+        if arts is None or plane not in self._PLANE_AXES:
             return
-        sz_k, sz_j, sz_i = self.np_vol.shape
-        try:
-            sx, sy, sz = self.meta["spacing"]
-        except Exception:
-            try:
-                sx, sy, sz = self.sitk_img.GetSpacing()
-            except Exception:
-                sx, sy, sz = (1.0, 1.0, 1.0)
-        for roi in self.rois:
-            color, text_label = self._get_roi_draw_params(roi)
-            ci, cj, ck = roi["center_voxel"]
-            r_mm = roi["radius_mm"]
-            if plane == "axial":
-                d_mm = abs((slice_index - ck) * sz)
-                if d_mm > r_mm:
-                    continue
-                r2d_mm = (r_mm * r_mm - d_mm * d_mm) ** 0.5
-                x = ci * sx
-                y = cj * sy
-            elif plane == "sagittal":
-                d_mm = abs((slice_index - ci) * sx)
-                if d_mm > r_mm:
-                    continue
-                r2d_mm = (r_mm * r_mm - d_mm * d_mm) ** 0.5
-                x = cj * sy
-                y = ck * sz
-            elif plane == "coronal":
-                d_mm = abs((slice_index - cj) * sy)
-                if d_mm > r_mm:
-                    continue
-                r2d_mm = (r_mm * r_mm - d_mm * d_mm) ** 0.5
-                x = ci * sx
-                y = ck * sz
-            else:
-                continue
-            ax.plot(x, y, marker="+", color=color, markersize=8, alpha=0.8)
-            ellipse = Ellipse(
-                (x, y),
-                width=r2d_mm * 2.0,
-                height=r2d_mm * 2.0,
-                fill=False,
-                color=color,
-                linestyle="-",
-                alpha=0.8,
-                linewidth=1.5,
-            )
-            ax.add_patch(ellipse)
-            ax.text(x + 2, y + 2, text_label, color=color, fontsize=7)
-
-    def _draw_gt_on_plane(self, ax, plane, slice_index):
+        centers, radii, colors, labels = self._get_roi_arrays()
+        normal, ax_x, ax_y = self._PLANE_AXES[plane]
+        centers_mm = centers * (self._sx, self._sy, self._sz)
+        visible, widths = roi_sphere.slice_intersections(centers_mm[:, normal], radii, slice_pos_mm,
+                                                         use_numba=self._roi_kernels_ready())
+        xs = centers_mm[visible, ax_x]
+        ys = centers_mm[visible, ax_y]
+        vis_colors = [colors[n] for n in visible]
+        for n, x, y in zip(visible.tolist(), xs.tolist(), ys.tolist()):
+            self._overlay_label(ax, arts, x + 2, y + 2, labels[n], colors[n])
+        self._set_overlay_offsets(arts["roi_markers"], xs, ys, vis_colors)
+        ellipses = arts["roi_ellipses"]
+        ellipses.set_widths(widths)
+        ellipses.set_heights(widths)
+        ellipses.set_angles(np.zeros(len(widths)))
+        self._set_overlay_offsets(ellipses, xs, ys, vis_colors)
+
+    def _get_roi_arrays(self):
+        """
+        Centros (N, 3) em voxel, raios (N,) em mm, cores e rotulos das ROIs.
+        Refeito so quando as ROIs ou as predicoes mudam; compartilhado pelos tres paineis.
+        """
+        key = (id(self.rois), len(self.rois), self._rois_version, id(self.roi_pred_map))
+        cached = self._roi_arrays
+        if cached is None or cached[0] != key:
+            params = [self._get_roi_draw_params(roi) for roi in self.rois]
+            cached = self._roi_arrays = (key, (
+                np.array([roi["center_voxel"] for roi in self.rois], dtype=np.float64).reshape(-1, 3),
+                np.array([roi["radius_mm"] for roi in self.rois], dtype=np.float64),
+                [color for color, _ in params],
+                [label for _, label in params],
+            ))
+        return cached[1]
+
+    def _draw_gt_on_plane(self, ax, plane, slice_pos_mm, slice_step_mm):
+        arts = self._plane_artists.get(plane)
+        if arts is None:
+            return
+        xs, ys = [], []
         if not self.show_gt or not self.gt_lesions or self.meta is None or self.np_vol is None:
+            self._set_overlay_offsets(arts["gt_markers"], xs, ys, [])
             return
+        half_step = slice_step_mm * 0.5
         sz_k, sz_j, sz_i = self.np_vol.shape
-        try:
-            sx, sy, sz = self.meta["spacing"]
-        except Exception:
-            try:
-                sx, sy, sz = self.sitk_img.GetSpacing()
-            except Exception:
-                sx, sy, sz = (1.0, 1.0, 1.0)
-        for idx, lesion in enumerate(self.gt_lesions, 1):
-            x_mm, y_mm, z_mm = lesion["xyz_mm"]
-            vi, vj, vk = dicom_io.mm_to_voxel(x_mm, y_mm, z_mm, self.meta)
-            vi_int = int(round(vi))
-            vj_int = int(round(vj))
-            vk_int = int(round(vk))
+        sx, sy, sz = self._sx, self._sy, self._sz
+        vox = np.rint(self._m2v_batch(self._gt_xyz())).astype(int).tolist()
+        for idx, (lesion, (vi_int, vj_int, vk_int)) in enumerate(zip(self.gt_lesions, vox), 1):
             if not (0 <= vk_int < sz_k and 0 <= vi_int < sz_i and 0 <= vj_int < sz_j):
                 continue
             if plane == "axial":
-                if vk_int != slice_index:
+                if abs(vk_int * sz - slice_pos_mm) > half_step:
                     continue
                 x = vi_int * sx
                 y = vj_int * sy
             elif plane == "sagittal":
-                if vi_int != slice_index:
+                if abs(vi_int * sx - slice_pos_mm) > half_step:
                     continue
                 x = vj_int * sy
                 y = vk_int * sz
             elif plane == "coronal":
-                if vj_int != slice_index:
+                if abs(vj_int * sy - slice_pos_mm) > half_step:
                     continue
                 x = vi_int * sx
                 y = vk_int * sz
@@ -1563,62 +2124,247 @@ class ViewerApp:
                     extra.append(f"ISUP={isup}")
             if extra:
                 label += " | " + " | ".join(extra)
-            ax.plot(x, y, marker="x", color="magenta", markersize=8, linewidth=1.5)
-            ax.text(
-                x + 2,
-                y + 2,
-                label,
-                color="magenta",
-                fontsize=7,
-                fontweight="bold",
-            )
+            xs.append(x)
+            ys.append(y)
+            self._overlay_label(ax, arts, x + 2, y + 2, label, "magenta", fontweight="bold")
+        self._set_overlay_offsets(arts["gt_markers"], xs, ys, ["magenta"] * len(xs))
+
+    def _cached_panel_text(self, name, key, build):
+        """Texto de um painel (sidebar/info) reconstruido so quando a chave de estado muda."""
+        cached = self._panel_text_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = build()
+        self._panel_text_cache[name] = (key, text)
+        return text
+
+    def _info_key(self, case_name, rois_key):
+        return (
+            case_name, id(self.series_list), self.current_series_idx, rois_key,
+            self.show_predictions_panel, id(self.last_preds), len(self.last_preds),
+            self.show_gt, id(self.gt_lesions), len(self.gt_lesions), self.gt_threshold_mm,
+            self.gt_patient_id, self.gt_label_source, str(getattr(self, "gt_labels_stats", None)),
+            getattr(self, "gt_labels_error", None), id(self.meta), id(self.np_vol), self.last_export_dir,
+        )
+
+    def _frame_key(self, case_name, rois_key):
+        """Tudo o que update_plot le para montar o quadro; igual ao anterior = quadro identico."""
+        return (
+            self._info_key(case_name, rois_key),
+            tuple(self.center_voxel), self.mode, self.series_input_str, self.case_input_str,
+            self.voxel_input_str, self.is_locked, self.candidate_center, self.radius_mm,
+            id(self.cases_list), len(self.cases_list), self.current_case_idx, len(self.series_list),
+            tuple(self.t2_quick.values()), self.series_page, self.show_help, id(self.roi_pred_map),
+            len(self.roi_pred_map), self.last_message, self.last_key,
+            self.toast_message, self.toast_message is not None and time.monotonic() < self.toast_until,
+            self.crop_mode, self.interp_mode, self.display_interp, self._wl_drag["active"],
+            tuple(self.win.values()), tuple(self.level.values()), tuple(self.plane_flip_x.values()),
+            tuple(self.view_zoom.values()), tuple(self.view_pan.values()),
+            tuple((st["mode"], st["xlim"], st["ylim"], st["zoom"], st["pan"]) for st in self.view_state.values()),
+        )
 
-    def update_plot(self):
+    def _build_sidebar_text(self, rois_key):
+        """Sidebar montada por fragmentos; cada um so e refeito quando sua chave muda."""
+        frags = [
+            self._cached_panel_text(
+                "sidebar_patients",
+                (id(self.cases_list), len(self.cases_list), self.current_case_idx),
+                self._sidebar_patients_text,
+            ),
+            self._cached_panel_text(
+                "sidebar_series",
+                (id(self.series_list), len(self.series_list), self.current_series_idx,
+                 tuple(self.t2_quick.values()), self.series_page),
+                self._sidebar_series_text,
+            ),
+            self._cached_panel_text("sidebar_rois", rois_key, self._sidebar_rois_text),
+            self._cached_panel_text(
+                "sidebar_preds",
+                (self.show_predictions_panel, id(self.last_preds), len(self.last_preds)),
+                self._sidebar_preds_text,
+            ),
+            "\n".join(("", _HDR_GT, f"ON ({len(self.gt_lesions)} lesoes)" if self.show_gt else "OFF", "")),
+        ]
+        if self.show_help:
+            frags.append(self._get_help_text())
+        return "\n".join(f for f in frags if f is not None)
+
+    def _sidebar_patients_text(self):
+        if not self.cases_list:
+            return None
+        # linhas sem marcador feitas uma vez por lista de casos; so a linha atual ganha o ">"
+        key = (id(self.cases_list), len(self.cases_list))
+        if self._cases_sidebar_template is None or self._cases_sidebar_template[0] != key:
+            self._cases_sidebar_template = (key, [f" [{i+1}] {c[:15]}" for i, c in enumerate(self.cases_list)])
+        lines = self._cases_sidebar_template[1]
+        cur = self.current_case_idx
+        if 0 <= cur < len(lines):
+            lines = [*lines[:cur], ">" + lines[cur][1:], *lines[cur + 1:]]
+        return "\n".join([_HDR_PATIENTS, *lines, ""])
+
+    def _sidebar_series_text(self):
+        if not self.series_list:
+            return None
+        parts = [_HDR_T2]
+        key_map = {'axial': 'A', 'coronal': 'K', 'sagittal': 'S'}
+        for orient in ['axial', 'coronal', 'sagittal']:
+            idx = self.t2_quick[orient]
+            mark = ">" if idx == self.current_series_idx and idx is not None else " "
+            key = key_map[orient]
+            if idx is not None:
+                name = self.series_list[idx]['_name_12']
+                parts.append(f"{mark}({key}) {orient[:3].upper()}: {name}")
+            else:
+                parts.append(f"   ({key}) {orient[:3].upper()}: -")
+        parts.append("")
+        parts.append(f"=== SERIES ({self.series_page+1}/{self._series_pages}) ===")
+        start_idx = self.series_page * self.series_per_page
+        end_idx = min(start_idx + self.series_per_page, len(self.series_list))
+        parts.extend(
+            ('>' if i == self.current_series_idx else ' ') + ser['_row']
+            for i, ser in enumerate(self.series_list[start_idx:end_idx], start_idx)
+        )
+        parts.append("")
+        parts.append("Use [ ] to page")
+        return "\n".join(parts)
+
+    def _sidebar_rois_text(self):
+        parts = ["", _HDR_ROIS]
+        if not self.rois:
+            parts.append("Nenhuma ROI.")
+        else:
+            for roi in self.rois:
+                lid = roi["id"]
+                status = self.roi_status.get(lid, "??")
+                parts.append(f"{lid} | S:{roi['center_voxel'][2]} | R:{roi['radius_mm']:.1f} | {status}")
+                parts.append(f"  Pos:({roi['center_voxel'][0]},{roi['center_voxel'][1]})")
+        return "\n".join(parts)
+
+    def _sidebar_preds_text(self):
+        parts = ["", _HDR_PREDS]
+        if self.show_predictions_panel and self.last_preds:
+            for p in self.last_preds:
+                lesion = p.get("lesion", "?")
+                perc = p.get("risk_percent", p.get("prob_pos", 0.0) * 100.0)
+                cat = p.get("risk_category", "")
+                label = p.get("pred_label", "")
+                parts.append(f"{lesion}: {perc:.0f}% ({cat}) -> {label}")
+        else:
+            parts.append("Nenhuma.")
+        return "\n".join(parts)
+
+    def _build_gt_detail_text(self):
+        parts = [
+            "GT DETAIL:",
+            f"patient_id_resolved={self.gt_patient_id or 'None'}",
+            f"labels_source={self.gt_label_source or 'None'}",
+        ]
+        if getattr(self, "gt_labels_stats", None):
+            parts.append(f"labels_stats={self.gt_labels_stats}")
+        if not self.gt_lesions:
+            if self.gt_patient_id and self.gt_label_source:
+                parts.append(f"GT indisponivel: sem labels para {self.gt_patient_id}")
+            elif getattr(self, "gt_labels_error", None):
+                parts.append(f"GT indisponivel: {self.gt_labels_error}")
+            else:
+                parts.append("GT indisponivel: labels nao carregadas ou mapping ausente")
+        elif self.meta is None or self.np_vol is None:
+            parts.append("GT coords nao projetaveis")
+        else:
+            vox = np.rint(self._m2v_batch(self._gt_xyz())).astype(np.int64)
+            in_bounds = ((vox >= 0) & (vox < self.np_vol.shape[::-1])).all(axis=1)
+            parts.extend(
+                f"{lesion.get('lesion_id') or f'L{idx}'}: voxel=({vi},{vj},{vk}) slice={vk} in_bounds={str(ok).lower()}"
+                for idx, (lesion, (vi, vj, vk), ok) in enumerate(zip(self.gt_lesions, vox.tolist(), in_bounds.tolist()), 1)
+            )
+            if not in_bounds.any():
+                parts.append("GT coords nao projetaveis")
+            if not in_bounds.all():
+                parts.append("GT fora do volume desta serie.")
+        return "\n".join(parts)
+
+    def _build_info_text(self, case_name):
+        parts = [f"CASE: {case_name}"]
+        if self.series_list and self.current_series_idx < len(self.series_list):
+            s = self.series_list[self.current_series_idx]
+            parts.append(f"SERIES: {s['series_name']} ({s['orientation'].upper()})")
+        else:
+            parts.append("NO SERIES LOADED")
+        parts.append(f"ROIs: {len(self.rois)}")
+        if self.show_predictions_panel and self.last_preds:
+            parts.append(f"PREDICOES: {len(self.last_preds)}")
+        if self.show_gt:
+            parts.append(f"GT lesions: {len(self.gt_lesions)}")
+            parts.append("")
+            # bloco GT DETAIL so muda com as lesoes ou a serie; mudar ROIs nao o refaz
+            gt_key = (
+                id(self.gt_lesions), id(self.meta), id(self.np_vol), self.gt_patient_id, self.gt_label_source,
+                str(getattr(self, "gt_labels_stats", None)), getattr(self, "gt_labels_error", None),
+            )
+            parts.append(self._cached_panel_text("gt_detail", gt_key, self._build_gt_detail_text))
+        if self.show_gt and self.rois and self.gt_lesions:
+            parts.append("")
+            parts.append("ROI vs GT:")
+            # distancia de cada ROI a GT mais proxima, todas de uma vez
+            roi_xyz = np.array([roi["center_mm"] for roi in self.rois], dtype=np.float64)
+            d2 = ((roi_xyz[:, None, :] - self._gt_xyz()[None, :, :]) ** 2).sum(axis=-1)
+            best = np.sqrt(d2.min(axis=1))
+            parts.extend(
+                f"{roi['id']} -> {d:.1f} mm ({'PERTO' if d <= self.gt_threshold_mm else 'LONGE'})"
+                for roi, d in zip(self.rois, best.tolist())
+            )
+        status_flags = []
+        if self.last_export_dir:
+            status_flags.append("Export OK")
+        if self.last_preds:
+            status_flags.append("Model OK")
+        if self.show_gt and self.gt_lesions:
+            status_flags.append("GT OK")
+        if status_flags:
+            parts.append("")
+            parts.append("Status: " + ", ".join(status_flags))
+        parts.append("")
+        return "\n".join(parts)
+
+    def update_plot(self, full=False):
+        """
+        Atualiza a figura. No caminho rapido so os dados dos artists persistentes mudam
+        e o quadro e feito por blit; full=True (ou troca de serie/layout) recria tudo.
+        """
         if self.fig is None:
             return
-        self._apply_slots()
-        if self.ax_axial:
-            self.ax_axial.clear()
-            self.ax_axial.set_facecolor("black")
-            self.ax_axial.set_xticks([])
-            self.ax_axial.set_yticks([])
-        if self.ax_sag:
-            self.ax_sag.clear()
-            self.ax_sag.set_facecolor("black")
-            self.ax_sag.set_xticks([])
-            self.ax_sag.set_yticks([])
-        if self.ax_cor:
-            self.ax_cor.clear()
-            self.ax_cor.set_facecolor("black")
-            self.ax_cor.set_xticks([])
-            self.ax_cor.set_yticks([])
-        if self.ax_info:
-            self.ax_info.clear()
-            self.ax_info.set_facecolor("#202020")
-            self.ax_info.axis('off')
-        if hasattr(self, "ax_sidebar") and self.ax_sidebar:
-            self.ax_sidebar.clear()
-            self.ax_sidebar.set_facecolor("#303030")
-            self.ax_sidebar.axis('off')
+        layout = self._get_layout_assignment()
+        layout_key = (self.layout_mode, self.main_view, self.active_view, self.dev_layout_debug, id(self.np_vol))
+        if layout_key != self._layout_key or self.dev_layout_debug:
+            full = True
+        self._layout_key = layout_key
+        case_name = self.cases_list[self.current_case_idx] if self.cases_list else "None"
+        # ROIs sao alteradas no lugar (append, recentragem); quem altera incrementa _rois_version
+        rois_key = (id(self.rois), len(self.rois), self._rois_version)
+        # nada visivel mudou desde o ultimo quadro: nao refaz nada
+        frame_key = self._frame_key(case_name, rois_key)
+        if not full and not self._slots_dirty and frame_key == self._last_frame_key:
+            return
+        self._last_frame_key = frame_key
+        if self._slots_dirty:
+            self._apply_slots()
+        if full:
+            self.background = None
+            self._ax_backgrounds = {}
 
         if self.np_vol is not None:
-            sz_k, sz_j, sz_i = self.np_vol.shape
-            i, j, k = self.center_voxel
-            i = int(max(0, min(i, sz_i - 1)))
-            j = int(max(0, min(j, sz_j - 1)))
-            k = int(max(0, min(k, sz_k - 1)))
-            self._set_center_voxel(i, j, k)
-            layout = self._get_layout_assignment()
-            self._render_mpr_view(self.ax_axial, layout["main"])
-            self._render_mpr_view(self.ax_cor, layout["bottom_left"])
-            self._render_mpr_view(self.ax_sag, layout["bottom_right"])
-
-        layout = self._get_layout_assignment()
-        self._style_panel(self.ax_axial, layout["main"])
-        self._style_panel(self.ax_cor, layout["bottom_left"])
-        self._style_panel(self.ax_sag, layout["bottom_right"])
+            self._set_center_voxel(*self.center_voxel)
+        for ax, plane in (
+            (self.ax_axial, layout["main"]),
+            (self.ax_cor, layout["bottom_left"]),
+            (self.ax_sag, layout["bottom_right"]),
+        ):
+            if full or self._im_artists.get(plane) is None or self._im_artists[plane].axes is not ax:
+                self._render_mpr_full(ax, plane)
+            else:
+                self._render_mpr_fast(ax, plane)
+            self._style_panel(ax, plane)
 
-        case_name = self.cases_list[self.current_case_idx] if self.cases_list else "None"
         if self.mode == "SERIES_SELECT":
             mode_str = f"GO TO SERIES: {self.series_input_str}_ (Enter confirm, Esc cancel)"
         elif self.mode == "CASE_SELECT":
@@ -1630,22 +2376,23 @@ class ViewerApp:
         if self.series_list and self.current_series_idx < len(self.series_list):
             s = self.series_list[self.current_series_idx]
             cv_i, cv_j, cv_k = self.center_voxel
-            line1 = f"CASE: {case_name} | SERIES: {s['series_name'][:20]} ({s['orientation'].upper()})"
+            line1 = f"CASE: {case_name} | SERIES: {s['_name_20']} ({s['orientation'].upper()})"
             line2 = f"CENTER (i,j,k)=({cv_i},{cv_j},{cv_k}) | R: {self.radius_mm:.1f} mm | MODE: {mode_str}"
         else:
             line1 = f"CASE: {case_name} | NO SERIES LOADED"
             line2 = f"MODE: {mode_str}"
-        hud_text = f"{line1}\n{line2}"
+        hud_parts = [line1, line2]
         if self.last_message:
-            hud_text += f"\nLAST: {self.last_message}"
+            hud_parts.append(f"LAST: {self.last_message}")
         if self.last_key:
-            hud_text += f"\nKEY: {self.last_key}"
+            hud_parts.append(f"KEY: {self.last_key}")
+        hud_text = "\n".join(hud_parts)
         if self.ax_axial:
-            self.ax_axial.text(
+            self._text_artist(
+                "hud",
+                self.ax_axial,
                 0.01,
                 1.01,
-                hud_text,
-                transform=self.ax_axial.transAxes,
                 verticalalignment="bottom",
                 horizontalalignment="left",
                 family="monospace",
@@ -1653,22 +2400,16 @@ class ViewerApp:
                 color="white",
                 fontweight="bold",
                 bbox=dict(facecolor="black", alpha=0.6, edgecolor="none", boxstyle="round,pad=0.4"),
-            )
+            ).set_text(hud_text)
 
         if self.dev_layout_debug:
             self._debug_slot_sizes()
 
-        if self.toast_artist is not None:
-            try:
-                self.toast_artist.remove()
-            except Exception:
-                pass
-            self.toast_artist = None
-        if self.toast_message and time.time() < self.toast_until:
+        if self.toast_artist is None:
             self.toast_artist = self.fig.text(
                 0.5,
                 0.02,
-                self.toast_message,
+                "",
                 transform=self.fig.transFigure,
                 ha="center",
                 va="bottom",
@@ -1676,170 +2417,179 @@ class ViewerApp:
                 fontsize=10,
                 color="yellow",
                 bbox=dict(facecolor="black", alpha=0.8, edgecolor="yellow", boxstyle="round,pad=0.4"),
+                animated=True,
+                visible=False,
             )
-        elif self.toast_message and time.time() >= self.toast_until:
-            self.toast_message = None
-
-        total_series_pages = (len(self.series_list) - 1) // self.series_per_page + 1 if self.series_list else 0
-        sidebar_text = ""
-        if self.cases_list:
-            sidebar_text += "=== PATIENTS ===\n"
-            for i, c in enumerate(self.cases_list):
-                mark = ">" if i == self.current_case_idx else " "
-                sidebar_text += f"{mark}[{i+1}] {c[:15]}\n"
-            sidebar_text += "\n"
-        if self.series_list:
-            sidebar_text += "=== T2 QUICK ===\n"
-            for orient in ['axial', 'coronal', 'sagittal']:
-                idx = self.t2_quick[orient]
-                mark = ">" if idx == self.current_series_idx and idx is not None else " "
-                key_map = {'axial': 'A', 'coronal': 'K', 'sagittal': 'S'}
-                key = key_map[orient]
-                if idx is not None:
-                    name = self.series_list[idx]['series_name'][:12]
-                    sidebar_text += f"{mark}({key}) {orient[:3].upper()}: {name}\n"
-                else:
-                    sidebar_text += f"   ({key}) {orient[:3].upper()}: -\n"
-            sidebar_text += "\n"
-            sidebar_text += f"=== SERIES ({self.series_page+1}/{total_series_pages}) ===\n"
-            start_idx = self.series_page * self.series_per_page
-            end_idx = min(start_idx + self.series_per_page, len(self.series_list))
-            for i in range(start_idx, end_idx):
-                ser = self.series_list[i]
-                mark = ">" if i == self.current_series_idx else " "
-                sidebar_text += f"{mark}[{i+1}] {ser['series_name'][:12]} ({ser['orientation'][0].upper()})\n"
-            sidebar_text += "\nUse [ ] to page\n"
-        sidebar_text += "\n=== ROIs ===\n"
-        if not self.rois:
-            sidebar_text += "Nenhuma ROI.\n"
-        else:
-            for roi in self.rois:
-                lid = roi["id"]
-                status = self.roi_status.get(lid, "??")
-                sidebar_text += (
-                    f"{lid} | S:{roi['center_voxel'][2]} | R:{roi['radius_mm']:.1f} | {status}\n"
-                    f"  Pos:({roi['center_voxel'][0]},{roi['center_voxel'][1]})\n"
-                )
-        sidebar_text += "\n=== PREDICOES ===\n"
-        if self.show_predictions_panel and self.last_preds:
-            for p in self.last_preds:
-                lesion = p.get("lesion", "?")
-                perc = p.get("risk_percent", p.get("prob_pos", 0.0) * 100.0)
-                cat = p.get("risk_category", "")
-                label = p.get("pred_label", "")
-                sidebar_text += f"{lesion}: {perc:.0f}% ({cat}) -> {label}\n"
-        else:
-            sidebar_text += "Nenhuma.\n"
-        sidebar_text += "\n=== GT ===\n"
-        if self.show_gt:
-            sidebar_text += f"ON ({len(self.gt_lesions)} lesoes)\n"
+        if self.toast_message and time.monotonic() < self.toast_until:
+            self.toast_artist.set_text(self.toast_message)
+            self.toast_artist.set_visible(True)
         else:
-            sidebar_text += "OFF\n"
-        if self.show_help:
-            sidebar_text += "\n" + self._get_help_text()
-        if hasattr(self, "ax_sidebar") and self.ax_sidebar:
-            self.ax_sidebar.text(
+            if self.toast_message:
+                self.toast_message = None
+            self.toast_artist.set_visible(False)
+
+        # paineis laterais: texto estatico no fundo; so forcam um draw completo quando mudam.
+        # ocultos (ou ausentes): nem monta o texto
+        panels_changed = False
+        if self.ax_sidebar is not None and self.ax_sidebar.get_visible():
+            art = self._text_artist(
+                "sidebar",
+                self.ax_sidebar,
                 0.02,
                 0.98,
-                sidebar_text,
-                transform=self.ax_sidebar.transAxes,
+                animated=False,
                 verticalalignment="top",
                 family="monospace",
                 fontsize=8,
                 color="white",
             )
-
-        info_panel_text = ""
-        if self.series_list and self.current_series_idx < len(self.series_list):
-            s = self.series_list[self.current_series_idx]
-            info_panel_text += f"CASE: {case_name}\n"
-            info_panel_text += f"SERIES: {s['series_name']} ({s['orientation'].upper()})\n"
-        else:
-            info_panel_text += f"CASE: {case_name}\nNO SERIES LOADED\n"
-        info_panel_text += f"ROIs: {len(self.rois)}\n"
-        if self.show_predictions_panel and self.last_preds:
-            info_panel_text += f"PREDICOES: {len(self.last_preds)}\n"
-        if self.show_gt:
-            info_panel_text += f"GT lesions: {len(self.gt_lesions)}\n"
-        if self.show_gt:
-            info_panel_text += "\nGT DETAIL:\n"
-            info_panel_text += f"patient_id_resolved={self.gt_patient_id or 'None'}\n"
-            info_panel_text += f"labels_source={self.gt_label_source or 'None'}\n"
-            if getattr(self, "gt_labels_stats", None):
-                info_panel_text += f"labels_stats={self.gt_labels_stats}\n"
-            if not self.gt_lesions:
-                if self.gt_patient_id and self.gt_label_source:
-                    info_panel_text += f"GT indisponivel: sem labels para {self.gt_patient_id}\n"
-                elif getattr(self, "gt_labels_error", None):
-                    info_panel_text += f"GT indisponivel: {self.gt_labels_error}\n"
-                else:
-                    info_panel_text += "GT indisponivel: labels nao carregadas ou mapping ausente\n"
-            elif self.meta is None or self.np_vol is None:
-                info_panel_text += "GT coords nao projetaveis\n"
-            else:
-                sz_k, sz_j, sz_i = self.np_vol.shape
-                any_proj = False
-                any_oob = False
-                for idx, lesion in enumerate(self.gt_lesions, 1):
-                    x, y, z = lesion["xyz_mm"]
-                    vi, vj, vk = dicom_io.mm_to_voxel(x, y, z, self.meta)
-                    vi_int = int(round(vi))
-                    vj_int = int(round(vj))
-                    vk_int = int(round(vk))
-                    in_bounds = (
-                        0 <= vk_int < sz_k and
-                        0 <= vi_int < sz_i and
-                        0 <= vj_int < sz_j
-                    )
-                    if in_bounds:
-                        any_proj = True
-                    else:
-                        any_oob = True
-                    lid = lesion.get("lesion_id") or f"L{idx}"
-                    info_panel_text += f"{lid}: voxel=({vi_int},{vj_int},{vk_int}) slice={vk_int} in_bounds={str(in_bounds).lower()}\n"
-                if not any_proj:
-                    info_panel_text += "GT coords nao projetaveis\n"
-                if any_oob:
-                    info_panel_text += "GT fora do volume desta serie.\n"
-        if self.show_gt and self.rois and self.gt_lesions:
-            info_panel_text += "\nROI vs GT:\n"
-            for roi in self.rois:
-                best = None
-                for lesion in self.gt_lesions:
-                    x, y, z = lesion["xyz_mm"]
-                    cx, cy, cz = roi["center_mm"]
-                    dx = cx - x
-                    dy = cy - y
-                    dz = cz - z
-                    dist = (dx * dx + dy * dy + dz * dz) ** 0.5
-                    if best is None or dist < best[0]:
-                        best = (dist, lesion)
-                if best is not None:
-                    dist_mm, _ = best
-                    status = "PERTO" if dist_mm <= self.gt_threshold_mm else "LONGE"
-                    info_panel_text += f"{roi['id']} -> {dist_mm:.1f} mm ({status})\n"
-        status_flags = []
-        if self.last_export_dir:
-            status_flags.append("Export OK")
-        if self.last_preds:
-            status_flags.append("Model OK")
-        if self.show_gt and self.gt_lesions:
-            status_flags.append("GT OK")
-        if status_flags:
-            info_panel_text += "\nStatus: " + ", ".join(status_flags) + "\n"
-        if self.ax_info:
-            self.ax_info.text(
+            sidebar_text = self._build_sidebar_text(rois_key)
+            if art.get_text() != sidebar_text:
+                art.set_text(sidebar_text)
+                panels_changed = True
+
+        if self.ax_info is not None and self.ax_info.get_visible():
+            info_panel_text = self._cached_panel_text(
+                "info", self._info_key(case_name, rois_key), lambda: self._build_info_text(case_name)
+            )
+            art = self._text_artist(
+                "info",
+                self.ax_info,
                 0.05,
                 0.95,
-                info_panel_text,
-                transform=self.ax_info.transAxes,
+                animated=False,
                 verticalalignment='top',
                 family='monospace',
                 fontsize=8,
                 color="white",
             )
+            if art.get_text() != info_panel_text:
+                art.set_text(info_panel_text)
+                panels_changed = True
 
-        self.fig.canvas.draw_idle()
+        canvas = self.fig.canvas
+        if full or panels_changed or self.background is None or not getattr(canvas, "supports_blit", False):
+            canvas.draw_idle()
+        else:
+            self._blit_frame()
+
+    def _apply_wl_fast(self, plane):
+        """Arraste de W/L: so muda o clim da imagem do painel e faz blit, sem reamostrar a fatia."""
+        im = self._im_artists.get(plane)
+        arts = self._plane_artists.get(plane)
+        win, level = self._get_wl_for_plane(plane)
+        if (
+            im is None or arts is None or win is None or level is None
+            or im.axes not in self._ax_backgrounds
+            or not getattr(self.fig.canvas, "supports_blit", False)
+        ):
+            self._schedule_update()
+            return
+        if arts.get("lut_applied"):
+            self._own_norm(im)
+            im.set_array(arts["raw"])
+            arts["lut_applied"] = False
+        im.set_clim(level - win / 2.0, level + win / 2.0)
+        self._blit_axes(im.axes)
+
+    def _own_norm(self, im):
+        """Da ao painel um norm proprio antes de mexer no clim (o norm uint8 e compartilhado)."""
+        if im.norm is self._norm_u8:
+            im.set_norm(Normalize())
+
+    def _schedule_update(self):
+        """
+        Agrupa rajadas de eventos (scroll, arraste, teclas repetidas) em um unico
+        update_plot por quadro (~16 ms). Sem loop de eventos, atualiza na hora.
+        """
+        if self.fig is None:
+            return
+        if self._update_timer is None:
+            timer = self.fig.canvas.new_timer(interval=16)
+            if type(timer) is TimerBase:
+                # backend sem loop de eventos (Agg): o timer nunca dispararia
+                self.update_plot()
+                return
+            timer.single_shot = True
+            timer.add_callback(self._do_update)
+            self._update_timer = timer
+        if not self._pending_update:
+            self._pending_update = True
+            self._update_timer.start()
+
+    def _schedule_wl_fast(self, plane):
+        """
+        Coalesce os eventos de movimento do arraste de W/L: no maximo um blit por
+        quadro (~16 ms), sempre com o W/L mais recente. Sem loop de eventos, aplica na hora.
+        """
+        if self.fig is None:
+            return
+        if self._wl_timer is None:
+            timer = self.fig.canvas.new_timer(interval=16)
+            if type(timer) is TimerBase:
+                self._apply_wl_fast(plane)
+                return
+            timer.single_shot = True
+            timer.add_callback(self._flush_wl_fast)
+            self._wl_timer = timer
+        if self._wl_pending_plane is None:
+            self._wl_timer.start()
+        self._wl_pending_plane = plane
+
+    def _flush_wl_fast(self):
+        plane, self._wl_pending_plane = self._wl_pending_plane, None
+        if plane is not None:
+            self._apply_wl_fast(plane)
+
+    def _do_update(self):
+        self._pending_update = False
+        self.update_plot()
+
+    def _text_artist(self, key, ax, x, y, animated=True, **kwargs):
+        """
+        Text persistente por chave; recriado so se o eixo foi limpo. Com animated=False
+        o texto fica no fundo capturado e nao e redesenhado a cada blit.
+        """
+        art = self._text_artists.get(key)
+        if art is None or art.axes is not ax:
+            art = ax.text(x, y, "", transform=ax.transAxes, animated=animated, **kwargs)
+            self._text_artists[key] = art
+        return art
+
+    def _draw_animated(self):
+        for ax in self.fig.axes:
+            for artist in sorted(ax.get_children(), key=lambda a: a.get_zorder()):
+                if artist.get_animated() and artist.get_visible():
+                    ax.draw_artist(artist)
+        for artist in self.fig.texts:
+            if artist.get_animated() and artist.get_visible():
+                self.fig.draw_artist(artist)
+
+    def _blit_axes(self, ax):
+        """Redesenha so um painel MPR: fundo do eixo, artists animados dele e blit do bbox."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self._ax_backgrounds[ax])
+        hud = set(self._text_artists.values())
+        for artist in sorted(ax.get_children(), key=lambda a: a.get_zorder()):
+            if not (artist.get_animated() and artist.get_visible()):
+                continue
+            if artist in hud:
+                # o HUD passa da borda do eixo: redesenha so a parte dentro do bbox restaurado
+                clip_on, clip_box = artist.get_clip_on(), artist.get_clip_box()
+                artist.set_clip_on(True)
+                artist.set_clip_box(ax.bbox)
+                ax.draw_artist(artist)
+                artist.set_clip_box(clip_box)
+                artist.set_clip_on(clip_on)
+            else:
+                ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+
+    def _blit_frame(self):
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self._draw_animated()
+        canvas.blit(self.fig.bbox)
 
     def _toggle_gt(self):
         try:
@@ -1850,6 +2600,7 @@ class ViewerApp:
         if not self.show_gt:
             self.show_gt = True
             if self.cases_list and self.current_case_idx >= 0:
+                self._gt_cache.pop(self.cases_list[self.current_case_idx], None)
                 self._load_gt_for_case()
             if not self.gt_lesions:
                 if not gt_status.get("ok"):
@@ -1883,31 +2634,33 @@ class ViewerApp:
             self.last_message = "GT OFF"
         self.update_plot()
 
+    def _gt_xyz(self):
+        """Centros das lesoes GT em mm como array (N, 3), refeito quando gt_lesions muda."""
+        cached = self._gt_xyz_cache
+        if cached is None or cached[0] is not self.gt_lesions:
+            xyz = np.array([lesion["xyz_mm"] for lesion in self.gt_lesions], dtype=np.float64).reshape(-1, 3)
+            cached = self._gt_xyz_cache = (self.gt_lesions, xyz)
+        return cached[1]
+
+    def _series_by_uid(self):
+        """Indice series_uid -> serie, refeito quando series_list muda."""
+        cached = self._series_by_uid_cache
+        if cached is None or cached[0] is not self.series_list or cached[1] != len(self.series_list):
+            # reversed: com UIDs repetidos vale a primeira serie, como no scan linear
+            by_uid = {s['series_uid']: s for s in reversed(self.series_list)}
+            cached = self._series_by_uid_cache = (self.series_list, len(self.series_list), by_uid)
+        return cached[2]
+
     def _jump_to_gt_slice(self):
         if not self.gt_lesions or self.meta is None or self.np_vol is None:
             return
+        gt_xyz = self._gt_xyz()
+        # sem ROIs a referencia e a propria primeira lesao
+        best = 0
         if self.rois:
-            ref = self.rois[-1]["center_mm"]
-        else:
-            ref = self.gt_lesions[0]["xyz_mm"]
-        best = None
-        for lesion in self.gt_lesions:
-            x, y, z = lesion["xyz_mm"]
-            cx, cy, cz = ref
-            dx = cx - x
-            dy = cy - y
-            dz = cz - z
-            dist = (dx * dx + dy * dy + dz * dz) ** 0.5
-            if best is None or dist < best[0]:
-                best = (dist, lesion)
-        if best is None:
-            return
-        x, y, z = best[1]["xyz_mm"]
-        vi, vj, vk = dicom_io.mm_to_voxel(x, y, z, self.meta)
-        i = int(round(vi))
-        j = int(round(vj))
-        k = int(round(vk))
-        self._set_center_voxel(i, j, k)
+            ref = np.asarray(self.rois[-1]["center_mm"], dtype=np.float64)
+            best = int(np.argmin(((gt_xyz - ref) ** 2).sum(axis=1)))
+        self._set_center_voxel(*np.rint(self._m2v(*gt_xyz[best])).astype(np.int64).tolist())
         self.last_message = "Pulando para GT mais proxima"
         self.update_plot()
 
@@ -1916,13 +2669,17 @@ class ViewerApp:
             return
         if event.inaxes is None:
             return
+        # eventos sub-pixel (HiDPI, tremor do mouse) nao mudam pan, W/L nem painel ativo
+        xy = (int(event.x), int(event.y))
+        if xy == self._last_motion_xy:
+            return
+        self._last_motion_xy = xy
         plane = self._plane_for_axes(event.inaxes)
         if plane is None:
             return
         if plane != self.active_view:
             self.active_view = plane
-            if self.fig:
-                self.update_plot()
+            self._schedule_update()
         if self._pan_drag["active"] and self._pan_drag["plane"] == plane:
             ax = event.inaxes
             if ax is None:
@@ -1930,12 +2687,9 @@ class ViewerApp:
             start_x, start_y = self._pan_drag["start_xy"]
             dx_px = event.x - start_x
             dy_px = event.y - start_y
-            x0, x1 = ax.get_xlim()
-            y1, y0 = ax.get_ylim()
-            width_px = max(ax.bbox.width, 1.0)
-            height_px = max(ax.bbox.height, 1.0)
-            mm_per_px_x = (x1 - x0) / width_px
-            mm_per_px_y = (y0 - y1) / height_px if (y0 - y1) != 0 else 0.0
+            if self._pan_drag.get("mm_per_px") is None:
+                self._pan_drag["mm_per_px"] = self._mm_per_px(ax)
+            mm_per_px_x, mm_per_px_y = self._pan_drag["mm_per_px"]
             dx_mm = -dx_px * mm_per_px_x
             dy_mm = -dy_px * mm_per_px_y
             state = self.view_state.get(plane)
@@ -1944,7 +2698,7 @@ class ViewerApp:
                 ylim0, ylim1 = state["ylim"]
                 state["xlim"] = (xlim0 + dx_mm, xlim1 + dx_mm)
                 state["ylim"] = (ylim0 + dy_mm, ylim1 + dy_mm)
-            self.update_plot()
+            self._schedule_update()
             return
         if self._wl_drag["active"] and self._wl_drag["plane"] == plane:
             start_x, start_y = self._wl_drag["start_xy"]
@@ -1966,9 +2720,16 @@ class ViewerApp:
             new_level = base_level - dy * (base_win * 0.01)
             self.win[plane] = new_win
             self.level[plane] = new_level
-            self.update_plot()
+            self._schedule_wl_fast(plane)
             return
 
+    @staticmethod
+    def _mm_per_px(ax):
+        """mm por pixel de tela (x, y) do eixo com os limites atuais."""
+        x0, x1 = ax.get_xlim()
+        y1, y0 = ax.get_ylim()
+        return (x1 - x0) / max(ax.bbox.width, 1.0), (y0 - y1) / max(ax.bbox.height, 1.0)
+
     def on_scroll(self, event):
         if self.mode in ["SERIES_SELECT", "CASE_SELECT"]:
             return
@@ -1997,20 +2758,14 @@ class ViewerApp:
         state["xlim"] = (cx - new_half_w, cx + new_half_w)
         state["ylim"] = (cy - new_half_h, cy + new_half_h)
         state["zoom"] = max(1.0, state.get("zoom", 1.0) * factor)
-        self.update_plot()
+        self._pan_drag["mm_per_px"] = None
+        self._schedule_update()
 
     def on_click(self, event):
         if self.mode in ["SERIES_SELECT", "CASE_SELECT"]:
             return
         if event.inaxes is None:
             return
-        try:
-            sx, sy, sz = self.meta["spacing"]
-        except Exception:
-            try:
-                sx, sy, sz = self.sitk_img.GetSpacing()
-            except Exception:
-                sx, sy, sz = (1.0, 1.0, 1.0)
         plane = self._plane_for_axes(event.inaxes)
         if plane is None:
             return
@@ -2023,6 +2778,8 @@ class ViewerApp:
             self._pan_drag["plane"] = plane
             self._pan_drag["start_xy"] = (event.x, event.y)
             self._pan_drag["start_pan"] = None
+            # escala fixa durante o arraste; o zoom (on_scroll) a invalida
+            self._pan_drag["mm_per_px"] = self._mm_per_px(event.inaxes)
             return
         if event.button == 3:
             if self.meta is None or self.np_vol is None:
@@ -2045,72 +2802,160 @@ class ViewerApp:
             return
         i, j, k = self.center_voxel
         if plane == "axial":
-            i = int(round(event.xdata / sx))
-            j = int(round(event.ydata / sy))
+            i = int(round(event.xdata * self._inv_sx))
+            j = int(round(event.ydata * self._inv_sy))
         elif plane == "sagittal":
-            j = int(round(event.xdata / sy))
-            k = int(round(event.ydata / sz))
+            j = int(round(event.xdata * self._inv_sy))
+            k = int(round(event.ydata * self._inv_sz))
         elif plane == "coronal":
-            i = int(round(event.xdata / sx))
-            k = int(round(event.ydata / sz))
+            i = int(round(event.xdata * self._inv_sx))
+            k = int(round(event.ydata * self._inv_sz))
         self._set_center_voxel(i, j, k)
         self.candidate_center = [i, j, k]
         self.is_locked = True
         self.last_message = "Centro travado. Pressione Enter para confirmar."
-        self.update_plot()
+        self._schedule_update()
 
-    def on_key(self, event):
-        try:
-            self.last_key = event.key
-            print(f"[KEY] mode={self.mode} key={event.key}")
-            if event.key == 'q':
-                plt.close()
-                return
+    def _build_key_dispatch(self):
+        """Tabela tecla -> handler do modo NORMAL (os modos de entrada tratam as teclas a parte)."""
+        return {
+            'escape': self._key_exit_focus,
+            'a': lambda: self._key_main_view('axial'),
+            'k': lambda: self._key_main_view('coronal'),
+            's': lambda: self._key_main_view('sagittal'),
+            'g': self._toggle_gt,
+            'G': self._key_gt_jump,
+            'ctrl+g': lambda: self._key_enter_mode("SERIES_SELECT"),
+            'l': lambda: self._key_enter_mode("VOXEL_JUMP"),
+            'o': self.open_data_root,
+            'c': lambda: self._key_enter_mode("CASE_SELECT"),
+            'ctrl+up': lambda: self.next_patient(-1),
+            'ctrl+down': lambda: self.next_patient(1),
+            'up': lambda: self._key_move_slice(1),
+            'right': lambda: self._key_move_slice(1),
+            'down': lambda: self._key_move_slice(-1),
+            'left': lambda: self._key_move_slice(-1),
+            'z': self._key_toggle_crop,
+            'd': self._key_toggle_debug,
+            'i': self._key_toggle_interp,
+            'r': lambda: self._key_reset_views([self.active_view]),
+            'R': lambda: self._key_reset_views(["axial", "coronal", "sagittal"]),
+            '+': lambda: self._key_radius(0.5),
+            '=': lambda: self._key_radius(0.5),
+            '-': lambda: self._key_radius(-0.5),
+            '_': lambda: self._key_radius(-0.5),
+            'x': self._key_clear_selection,
+            'enter': self.confirm_roi,
+            'delete': self.delete_last_roi,
+            'j': self.save_json,
+            'ctrl+s': self.save_json,
+            'e': self.export_all_to_pipeline,
+            'f': self.open_last_export_dir,
+            'v': self.validate_rois,
+            'p': self._key_toggle_preds,
+            'ctrl+p': self._key_pdf,
+            'h': self._key_toggle_help,
+            ']': lambda: self._key_series_page(1),
+            '[': lambda: self._key_series_page(-1),
+        }
 
-            is_ctrl = event.key.startswith('ctrl+')
+    def _key_exit_focus(self):
+        if getattr(self, "layout_mode", "normal") == "focus":
+            self.layout_mode = "normal"
+            self._apply_slots()
+            self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == "escape" and getattr(self, "layout_mode", "normal") == "focus":
-                self.layout_mode = "normal"
-                self._apply_slots()
-                self.update_plot()
-                return
+    def _key_main_view(self, target):
+        self.main_view = target
+        self.active_view = target
+        self.last_message = f"Painel principal: {target.upper()}"
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and not is_ctrl and event.key in ['a', 'k', 's']:
-                mapping = {'a': 'axial', 'k': 'coronal', 's': 'sagittal'}
-                target = mapping.get(event.key)
-                if target:
-                    self.main_view = target
-                    self.active_view = target
-                    self.last_message = f"Painel principal: {target.upper()}"
-                    self.update_plot()
-                    return
+    def _key_gt_jump(self):
+        if not self.show_gt:
+            self._toggle_gt()
+        else:
+            self._jump_to_gt_slice()
+
+    def _key_enter_mode(self, mode):
+        self.mode = mode
+        if mode == "SERIES_SELECT":
+            self.series_input_str = ""
+        elif mode == "CASE_SELECT":
+            self.case_input_str = ""
+        else:
+            self.voxel_input_str = ""
+            self.last_message = "Digite i,j,k e pressione Enter"
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == 'g':
-                self._toggle_gt()
-                return
+    def _key_move_slice(self, delta):
+        self._move_center_slice(self.active_view, delta)
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == 'G':
-                if not self.show_gt:
-                    self._toggle_gt()
-                else:
-                    self._jump_to_gt_slice()
-                return
+    def _key_toggle_crop(self):
+        for plane in ["axial", "coronal", "sagittal"]:
+            state = self.view_state.get(plane)
+            if state is not None:
+                state["mode"] = "CROP" if state.get("mode") != "CROP" else "FULL"
+                state["xlim"] = None
+                state["ylim"] = None
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == 'ctrl+g':
-                self.mode = "SERIES_SELECT"
-                self.series_input_str = ""
-                self.update_plot()
-                return
+    def _key_toggle_debug(self):
+        self.dev_layout_debug = not self.dev_layout_debug
+        self.last_message = f"DEV DEBUG: {'ON' if self.dev_layout_debug else 'OFF'}"
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == "l":
-                self.mode = "VOXEL_JUMP"
-                self.voxel_input_str = ""
-                self.last_message = "Digite i,j,k e pressione Enter"
-                self.update_plot()
-                return
+    def _key_toggle_interp(self):
+        self.interp_mode = "nearest" if self.interp_mode != "nearest" else "bilinear"
+        self.last_message = f"Interpolacao: {self.interp_mode}"
+        self._schedule_update()
+
+    def _key_reset_views(self, planes):
+        for plane in planes:
+            state = self.view_state.get(plane)
+            if state is not None:
+                state["mode"] = "FULL"
+                state["xlim"] = None
+                state["ylim"] = None
+                state["zoom"] = 1.0
+                state["pan"] = (0.0, 0.0)
+        self._schedule_update()
+
+    def _key_radius(self, delta):
+        self.radius_mm = max(0.5, self.radius_mm + delta)
+        self._schedule_update()
+
+    def _key_clear_selection(self):
+        self.is_locked = False
+        self.candidate_center = None
+        self.last_message = "Selecao limpa."
+        self._schedule_update()
+
+    def _key_toggle_preds(self):
+        self.show_predictions_panel = not self.show_predictions_panel
+        logger.debug("pred_panel=%s", self.show_predictions_panel)
+        self._schedule_update()
+
+    def _key_pdf(self):
+        logger.debug("key=ctrl+p acao=gerar_pdf")
+        self.generate_pdf_report()
+
+    def _key_toggle_help(self):
+        self.show_help = not self.show_help
+        self._schedule_update()
 
-            if self.mode == "NORMAL" and event.key == 'o':
-                self.open_data_root()
+    def _key_series_page(self, delta):
+        self.series_page = min(max(self.series_page + delta, 0), max(self._series_pages - 1, 0))
+        self._schedule_update()
+
+    def on_key(self, event):
+        try:
+            self.last_key = event.key
+            logger.debug("key mode=%s key=%s", self.mode, event.key)
+            if event.key == 'q':
+                import matplotlib.pyplot as plt
+                plt.close(self.fig)
                 return
 
             # Seleção de Caso
@@ -2118,7 +2963,7 @@ class ViewerApp:
                  if event.key == 'enter':
                      try:
                          n = int(self.case_input_str)
-                         print(f"[DEBUG] Go-to case: {n}")
+                         logger.debug("goto_case n=%s", n)
                          if self.load_case(n - 1):
                              self.mode = "NORMAL"
                          else:
@@ -2127,30 +2972,31 @@ class ViewerApp:
                          self.last_message = "Entrada invalida (digite apenas numeros)"
                      
                      self.case_input_str = ""
-                     self.update_plot()
+                     self._schedule_update()
                  elif event.key == 'escape':
                      self.mode = "NORMAL"
                      self.case_input_str = ""
                      self.last_message = "Selecao de caso cancelada"
-                     self.update_plot()
+                     self._schedule_update()
                  elif event.key == 'backspace':
                      self.case_input_str = self.case_input_str[:-1]
-                     self.update_plot()
+                     self._schedule_update()
                  elif event.key is not None and len(event.key) == 1 and event.key.isdigit():
                      self.case_input_str += event.key
-                     self.update_plot()
+                     self._schedule_update()
                  return
 
             if self.mode == "SERIES_SELECT":
                 if event.key == 'enter':
                     try:
                         n = int(self.series_input_str)
-                        print(f"[DEBUG] Go-to series: {n}")
+                        logger.debug("goto_series n=%s", n)
                         idx = n - 1
                         if 0 <= idx < len(self.series_list):
                             self.current_series_idx = idx
                             self.load_current_series()
-                            self.last_message = f"Trocado para serie {n}"
+                            if self._series_load is None: # async: mantem "Carregando ..."
+                                self.last_message = f"Trocado para serie {n}"
                             self.series_page = idx // self.series_per_page
                             self.mode = "NORMAL"
                         else:
@@ -2159,22 +3005,24 @@ class ViewerApp:
                         self.last_message = "Entrada invalida (digite apenas numeros)"
                     
                     self.series_input_str = ""
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key == 'escape':
                     self.mode = "NORMAL"
                     self.series_input_str = ""
                     self.last_message = "Selecao cancelada"
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key == 'backspace':
                     self.series_input_str = self.series_input_str[:-1]
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key is not None and len(event.key) == 1 and event.key.isdigit():
                     self.series_input_str += event.key
-                    self.update_plot()
+                    self._schedule_update()
                 return
 
             if self.mode == "VOXEL_JUMP":
                 if event.key == "enter":
+                    if self._series_loading():
+                        return # sem volume o salto nao teria limites; o modo segue aberto
                     vals = re.findall(r"-?\d+", self.voxel_input_str or "")
                     if len(vals) >= 3:
                         try:
@@ -2187,121 +3035,33 @@ class ViewerApp:
                             self.last_message = "Entrada invalida (use i,j,k)"
                     else:
                         self.last_message = "Entrada invalida (use i,j,k)"
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key == "escape":
                     self.mode = "NORMAL"
                     self.voxel_input_str = ""
                     self.last_message = "Selecao cancelada"
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key == "backspace":
                     self.voxel_input_str = self.voxel_input_str[:-1]
-                    self.update_plot()
+                    self._schedule_update()
                 elif event.key is not None and len(event.key) == 1 and (event.key.isdigit() or event.key in [",", " ", ";", "-"]):
                     self.voxel_input_str += event.key
-                    self.update_plot()
+                    self._schedule_update()
                 return
 
             # MODO NORMAL
-            elif event.key == 'c':
-                self.mode = "CASE_SELECT"
-                self.case_input_str = ""
-                self.update_plot()
-            elif event.key == 'ctrl+up':
-                self.next_patient(-1)
-            elif event.key == 'ctrl+down':
-                self.next_patient(1)
-            elif event.key in ['up', 'right']:
-                self._move_center_slice(self.active_view, 1)
-                self.update_plot()
-            elif event.key in ['down', 'left']:
-                self._move_center_slice(self.active_view, -1)
-                self.update_plot()
-            elif event.key == 'z':
-                for plane in ["axial", "coronal", "sagittal"]:
-                    state = self.view_state.get(plane)
-                    if state is not None:
-                        state["mode"] = "CROP" if state.get("mode") != "CROP" else "FULL"
-                        state["xlim"] = None
-                        state["ylim"] = None
-                self.update_plot()
-            elif event.key == 'd':
-                self.dev_layout_debug = not self.dev_layout_debug
-                self.last_message = f"DEV DEBUG: {'ON' if self.dev_layout_debug else 'OFF'}"
-                self.update_plot()
-            elif event.key == 'i':
-                self.interp_mode = "nearest" if self.interp_mode != "nearest" else "bilinear"
-                self.last_message = f"Interpolacao: {self.interp_mode}"
-                self.update_plot()
-            elif event.key == 'r':
-                state = self.view_state.get(self.active_view)
-                if state is not None:
-                    state["mode"] = "FULL"
-                    state["xlim"] = None
-                    state["ylim"] = None
-                    state["zoom"] = 1.0
-                    state["pan"] = (0.0, 0.0)
-                self.update_plot()
-            elif event.key == 'R':
-                for plane in ["axial", "coronal", "sagittal"]:
-                    state = self.view_state.get(plane)
-                    if state is not None:
-                        state["mode"] = "FULL"
-                        state["xlim"] = None
-                        state["ylim"] = None
-                        state["zoom"] = 1.0
-                        state["pan"] = (0.0, 0.0)
-                self.update_plot()
-            elif event.key in ['+', '=']:
-                self.radius_mm += 0.5
-                self.update_plot()
-            elif event.key in ['-', '_']:
-                self.radius_mm = max(0.5, self.radius_mm - 0.5)
-                self.update_plot()
-            elif event.key == 'x':
-                self.is_locked = False
-                self.candidate_center = None
-                self.last_message = "Selecao limpa."
-                self.update_plot()
-            elif event.key == 'enter':
-                self.confirm_roi()
-            elif event.key == 'delete':
-                self.delete_last_roi()
-            elif event.key in ['j', 'ctrl+s']:
-                self.save_json()
-            elif event.key == 'e':
-                self.export_all_to_pipeline()
-            elif event.key == 'f':
-                self.open_last_export_dir()
-            elif event.key == 'v':
-                self.validate_rois()
-            elif event.key == 'p':
-                self.show_predictions_panel = not self.show_predictions_panel
-                if self.show_predictions_panel:
-                    print("Pred panel enabled")
-                else:
-                    print("Pred panel disabled")
-                self.update_plot()
-            elif event.key == 'ctrl+p':
-                print("[KEY] Ctrl+P -> Gerar PDF")
-                self.generate_pdf_report()
-            elif event.key == 'h':
-                self.show_help = not self.show_help
-                self.update_plot()
-            elif event.key == ']':
-                max_pages = (len(self.series_list) - 1) // self.series_per_page
-                self.series_page = min(self.series_page + 1, max_pages)
-                self.update_plot()
-            elif event.key == '[':
-                self.series_page = max(self.series_page - 1, 0)
-                self.update_plot()
+            handler = self._key_dispatch.get(event.key)
+            if handler is not None:
+                handler()
             elif event.key is not None and len(event.key) == 1 and event.key.isdigit() and event.key != '0':
                 # atalhos 1-9 (apenas se nao for 0)
                 idx = int(event.key) - 1
                 if idx < len(self.series_list):
                     self.current_series_idx = idx
                     self.load_current_series()
-                    self.last_message = f"Trocado para serie {idx+1}"
-                    self.update_plot()
+                    if self._series_load is None: # async: mantem "Carregando ..."
+                        self.last_message = f"Trocado para serie {idx+1}"
+                    self._schedule_update()
         except Exception:
             print("\n[ERRO] Excecao em on_key:")
             traceback.print_exc()
@@ -2311,6 +3071,7 @@ class ViewerApp:
             self.last_message = "Nenhuma ROI para remover"
         else:
             removed = self.rois.pop()
+            self._rois_version += 1
             self.last_message = f"ROI removida: {removed['id']}"
 
             case_name = self.cases_list[self.current_case_idx]
@@ -2328,7 +3089,17 @@ class ViewerApp:
                     self.lesion_counter = len(self.rois) + 1
         self.update_plot()
 
+    def _series_loading(self):
+        """True (com aviso no HUD) se a serie ainda esta sendo lida; sem volume nao ha ROI/export."""
+        if self._series_load is None:
+            return False
+        self.last_message = "Carregando serie... aguarde."
+        self._schedule_update()
+        return True
+
     def confirm_roi(self):
+        if self._series_loading():
+            return
         if not self.is_locked or not self.candidate_center:
             self.last_message = "AVISO: Trave o centro com clique primeiro!"
             self.update_plot()
@@ -2337,7 +3108,7 @@ class ViewerApp:
         i, j, k = self.candidate_center
         s = self.series_list[self.current_series_idx]
         
-        x, y, z = dicom_io.voxel_to_mm(i, j, k, self.meta)
+        x, y, z = self._v2m(i, j, k).tolist()
         
         roi = {
             "id": f"L{self.lesion_counter}",
@@ -2348,6 +3119,7 @@ class ViewerApp:
         }
         
         self.rois.append(roi)
+        self._rois_version += 1
         self.last_message = f"ROI L{self.lesion_counter} confirmada! (autosave OK)"
         
         case_name = self.cases_list[self.current_case_idx]
@@ -2362,77 +3134,152 @@ class ViewerApp:
         self.update_plot()
 
     def _export_roi_assets(self, roi):
-        """Salva PNG do slice atual com a ROI e atualiza manifest.csv."""
+        """Salva PNG do slice atual com a ROI (ou da fatia central, se a ROI nao a corta) e atualiza manifest.csv."""
+        if self._series_loading():
+            return
         case_name = self.cases_list[self.current_case_idx]
         s = self.series_list[self.current_series_idx]
         plane = s['orientation']
         
         roi_id = roi['id']
-        png_filename = f"case{case_name}_series{self.current_series_idx}_{plane}_slice{self.current_slice}_roi{roi_id}.png"
+        ci, cj, ck = roi['center_voxel']
+        r_mm = roi['radius_mm']
+
+        # corte da esfera na fatia exportada: so o indice k difere do centro
+        render_k = self.current_slice
+        dz_mm = abs((render_k - ck) * self._dz_per_k)
+        if dz_mm >= r_mm:
+            # ROI nao corta a fatia atual: exporta a fatia central da esfera
+            render_k = int(np.clip(ck, 0, self.max_slice))
+            dz_mm = abs((render_k - ck) * self._dz_per_k)
+            logger.info("export_png_fatia_central roi=%s fatia_atual=%s fatia=%s", roi_id, self.current_slice, render_k)
+        radii_px = None
+        if dz_mm < r_mm:
+            r_slice_mm = (r_mm**2 - dz_mm**2)**0.5
+            radii_px = (r_slice_mm * self._inv_sx, r_slice_mm * self._inv_sy)
+
+        png_filename = f"case{case_name}_series{self.current_series_idx}_{plane}_slice{render_k}_roi{roi_id}.png"
         png_path = os.path.join(self.roi_img_dir, png_filename)
-        
+        label = f"CASE: {case_name} | SERIES: {self.current_series_idx}\nSLICE: {render_k} | ROI: {roi_id} | R: {r_mm}mm"
+        slice_img = self._get_slice_u8(render_k)
+
+        # a codificacao do PNG nao depende da UI: vai para o pool de I/O
+        self._io_pool.submit(self._write_roi_png, slice_img, ci, cj, radii_px, label, png_path)
+
+        self._append_manifest_rows([[
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            case_name,
+            plane,
+            self.current_series_idx,
+            s['series_name'],
+            render_k, # mesma fatia do PNG ao lado
+            f"{roi['center_mm'][0]:.2f}",
+            f"{roi['center_mm'][1]:.2f}",
+            roi['radius_mm'],
+            self.dicom_root
+        ]])
+
+    def _append_manifest_rows(self, rows):
+        """Acrescenta linhas ao roi_manifest.csv pelo handle aberto da sessao."""
+        if not rows:
+            return
         try:
-            fig_tmp, ax_tmp = plt.subplots(figsize=(8, 8))
-            ax_tmp.imshow(self.np_vol[self.current_slice, :, :], cmap='gray')
-            
-            ci, cj, ck = roi['center_voxel']
-            r_mm = roi['radius_mm']
-            
-            # calculo de elipse para o export (mesma logica do _draw_roi_sphere)
-            p_center = dicom_io.voxel_to_mm(ci, cj, ck, self.meta)
-            p_here = dicom_io.voxel_to_mm(ci, cj, self.current_slice, self.meta)
-            dz_mm = abs(p_here[2] - p_center[2])
-            
-            if dz_mm < r_mm:
-                r_slice_mm = (r_mm**2 - dz_mm**2)**0.5
-                r_px_x = r_slice_mm / self.meta['spacing'][0]
-                r_px_y = r_slice_mm / self.meta['spacing'][1]
-                
-                ellipse = Ellipse((ci, cj), width=r_px_x*2, height=r_px_y*2, 
-                                 fill=False, color='lime', linewidth=2)
-                ax_tmp.add_patch(ellipse)
-                ax_tmp.plot(ci, cj, '+', color='lime', markersize=10)
-                
-            ax_tmp.text(5, 15, f"CASE: {case_name} | SERIES: {self.current_series_idx}\nSLICE: {self.current_slice} | ROI: {roi_id} | R: {r_mm}mm", 
-                        color='yellow', fontsize=10, bbox=dict(facecolor='black', alpha=0.5))
-            
-            ax_tmp.axis('off')
-            plt.tight_layout()
-            fig_tmp.savefig(png_path, dpi=100, bbox_inches='tight', pad_inches=0)
-            plt.close(fig_tmp)
-            
+            f = self._manifest_fh
+            if f is None or f.closed:
+                exists = os.path.isfile(self._manifest_path)
+                f = self._manifest_fh = open(self._manifest_path, 'a', newline='', buffering=1 << 16)
+                self._manifest_writer = csv.writer(f)
+                if not exists:
+                    f.write(_MANIFEST_HEADER)
+            for row in rows:
+                fields = ["" if v is None else str(v) for v in row]
+                # campos sem caracteres especiais dispensam o csv.writer
+                if any(c in fld for fld in fields for c in _CSV_SPECIAL):
+                    self._manifest_writer.writerow(fields)
+                else:
+                    f.write(",".join(fields) + "\r\n")
+            # flush (sem fsync) para nao perder linhas se o app cair
+            f.flush()
         except Exception as e:
-            print(f"[ERROR] Falha ao exportar PNG: {e}")
+            print(f"[ERROR] Falha ao atualizar manifest.csv: {e}")
 
-        manifest_path = os.path.join(self.export_dir, "roi_manifest.csv")
-        file_exists = os.path.isfile(manifest_path)
-        
+    def _close_manifest(self):
+        f = self._manifest_fh
+        self._manifest_fh = None
+        self._manifest_writer = None
+        if f is not None and not f.closed:
+            f.close()
+
+    def _write_roi_png(self, slice_img, ci, cj, radii_px, label, png_path):
+        """Job do pool de I/O: Pillow e, se falhar, o fallback matplotlib (serializado)."""
         try:
-            with open(manifest_path, 'a', newline='') as f:
-                writer = csv.writer(f)
-                if not file_exists:
-                    writer.writerow(["timestamp", "case", "plane", "series_index", "series_name", "slice_index", "x", "y", "radius_mm", "dicom_dir"])
-                
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    case_name,
-                    plane,
-                    self.current_series_idx,
-                    s['series_name'],
-                    self.current_slice,
-                    f"{roi['center_mm'][0]:.2f}",
-                    f"{roi['center_mm'][1]:.2f}",
-                    roi['radius_mm'],
-                    self.dicom_root
-                ])
+            self._render_roi_png(slice_img, ci, cj, radii_px, label, png_path)
         except Exception as e:
-            print(f"[ERROR] Falha ao atualizar manifest.csv: {e}")
+            logger.warning("export_png_pil_falhou erro=%s", e)
+            try:
+                with self._export_fig_lock:
+                    self._render_roi_png_mpl(slice_img, ci, cj, radii_px, label, png_path)
+            except Exception as e:
+                print(f"[ERROR] Falha ao exportar PNG: {e}")
+
+    @staticmethod
+    def _render_roi_png(slice_img, ci, cj, radii_px, label, path):
+        """Grava o PNG da ROI direto com Pillow (sem figura Agg)."""
+        img8 = np.asarray(slice_img)
+        if img8.dtype != np.uint8:
+            img = img8.astype(np.float32)
+            lo = float(img.min())
+            hi = float(img.max())
+            scale = 255.0 / (hi - lo) if hi > lo else 0.0
+            img8 = ((img - lo) * scale).clip(0, 255).astype(np.uint8)
+        rgb = Image.fromarray(img8, mode="L").convert("RGB")
+        draw = ImageDraw.Draw(rgb)
+        lime = (0, 255, 0)
+        if radii_px is not None:
+            rx, ry = radii_px
+            draw.ellipse((ci - rx, cj - ry, ci + rx, cj + ry), outline=lime, width=2)
+            draw.line((ci - 5, cj, ci + 5, cj), fill=lime, width=2)
+            draw.line((ci, cj - 5, ci, cj + 5), fill=lime, width=2)
+        # HUD: caixa preta 50% (escurece so a regiao da caixa, sem overlay RGBA do quadro todo) + texto amarelo
+        x0, y0, x1, y1 = draw.multiline_textbbox((5, 5), label)
+        box = (max(x0 - 3, 0), max(y0 - 3, 0), min(x1 + 3, rgb.width), min(y1 + 3, rgb.height))
+        if box[2] > box[0] and box[3] > box[1]:
+            region = np.asarray(rgb.crop(box)) >> 1
+            rgb.paste(Image.fromarray(region, mode="RGB"), box[:2])
+        draw.multiline_text((5, 5), label, fill=(255, 255, 0))
+        rgb.save(path, format="PNG", compress_level=3)
+
+    def _get_export_axes(self):
+        """Figura/axes de export reaproveitadas (fora do pyplot, nunca abrem janela)."""
+        if self._export_fig is None:
+            self._export_fig = Figure(figsize=(8, 8))
+            self._export_ax = self._export_fig.add_axes((0, 0, 1, 1))
+        ax = self._export_ax
+        ax.cla()
+        ax.set_axis_off()
+        return self._export_fig, ax
+
+    def _render_roi_png_mpl(self, slice_img, ci, cj, radii_px, label, path):
+        """Fallback: renderiza o PNG da ROI via matplotlib."""
+        fig_tmp, ax_tmp = self._get_export_axes()
+        # axes ocupa a figura inteira: 1 pixel da imagem = 1 pixel do PNG (dpi=100)
+        h, w = slice_img.shape[:2]
+        fig_tmp.set_size_inches(w / 100.0, h / 100.0)
+        ax_tmp.set_position((0, 0, 1, 1))
+        ax_tmp.imshow(slice_img, cmap='gray', aspect='auto')
+        if radii_px is not None:
+            ellipse = Ellipse((ci, cj), width=radii_px[0]*2, height=radii_px[1]*2,
+                              fill=False, color='lime', linewidth=2)
+            ax_tmp.add_patch(ellipse)
+            ax_tmp.plot(ci, cj, '+', color='lime', markersize=10)
+        ax_tmp.text(5, 15, label, color='yellow', fontsize=10, bbox=dict(facecolor='black', alpha=0.5))
+        fig_tmp.savefig(path, dpi=100)
 
     def open_last_export_dir(self):
         """Abre a pasta do último export no explorador de arquivos."""
         if not self.last_export_dir or not os.path.exists(self.last_export_dir):
             self.last_message = "Nenhum export realizado nesta sessao."
-            self.update_plot()
+            self._schedule_update()
             return
             
         try:
@@ -2448,7 +3295,7 @@ class ViewerApp:
         except Exception as e:
             self.last_message = f"Erro ao abrir pasta: {str(e)[:20]}"
             logger.exception("erro_abrir_pasta_export")
-        self.update_plot()
+        self._schedule_update()
 
     def open_data_root(self):
         """Abre seletor de pastas para mudar o data_root."""
@@ -2481,7 +3328,7 @@ class ViewerApp:
                         self.discover_workspace()
                         self.last_message = "Selecao cancelada. Pressione O para escolher um paciente."
                         if self.fig:
-                            self.update_plot()
+                            self._schedule_update()
                         return
                     self.input_root = str(Path(case_dir).resolve())
                     self.samples_root = None
@@ -2490,27 +3337,31 @@ class ViewerApp:
                 if self.cases_list:
                     self._save_config()
                     self.load_case(0)
-                    self.last_message = f"Paciente carregado: {self.cases_list[self.current_case_idx]}"
+                    if self._series_load is None: # async: mantem "Carregando ..."
+                        self.last_message = f"Paciente carregado: {self.cases_list[self.current_case_idx]}"
                 else:
                     self.input_root = old_root
                     self.samples_root = None
                     self.discover_workspace()
                 
-                if self.fig: self.update_plot()
+                self._schedule_update()
         except Exception as e:
             print(f"[WARNING] Erro ao abrir seletor de pastas: {e}")
             logger.exception("erro_abrir_seletor")
             self.last_message = "Erro ao abrir seletor de pastas."
-            if self.fig: self.update_plot()
+            self._schedule_update()
 
     def export_all_to_pipeline(self):
         """Exporta ROIs em JSON e máscaras NIfTI para o pipeline."""
+        if self._series_loading():
+            return
         if not self.rois:
             self.last_message = "AVISO: Nenhuma ROI para exportar."
-            self.update_plot()
+            self._schedule_update()
             return
 
-        case_name = self.cases_list[self.current_case_idx]
+        case_idx = self.current_case_idx
+        case_name = self.cases_list[case_idx]
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         export_case_dir = os.path.join(self.export_dir, case_name, timestamp)
         os.makedirs(export_case_dir, exist_ok=True)
@@ -2518,54 +3369,116 @@ class ViewerApp:
         try:
             json_path = os.path.join(export_case_dir, "rois.json")
             roi_export.save_roi_json(json_path, case_name, self.rois, self.input_root)
-            
-            mask_export.export_roi_masks(export_case_dir, self.sitk_img, self.rois, case_name)
-            
-            self.last_message = f"Export OK: {case_name}/{timestamp}"
-            self.last_export_dir = export_case_dir
-            print(f"\n[INFO] Export Pipeline completo em: {export_case_dir}")
+        except Exception as e:
+            self.last_message = f"ERRO no export: {str(e)[:20]}..."
+            logger.error("erro_export_pipeline etapa=json: %s", e, exc_info=True)
+            self._schedule_update()
+            return
 
-            try:
-                dicom_dir = Path(self.meta['series_dir']) if (self.meta and 'series_dir' in self.meta) else Path(self.dicom_root or '')
-                export_dir = Path(self.last_export_dir)
-                preds = predict_for_export_folder(dicom_dir=dicom_dir, export_dir=export_dir)
-                if preds:
-                    self.last_preds = preds
-                    self.roi_pred_map = {}
-                    for p in preds:
-                        lid = p.get("lesion")
-                        if lid:
-                            self.roi_pred_map[lid] = p
-                    if len(preds) == 1:
-                        first = preds[0]
-                        thr = first.get('thr_cv', first.get('threshold', 0.5))
-                        lesion = first.get('lesion', 'ROI')
-                        perc = first.get('risk_percent', first['prob_pos'] * 100.0)
-                        cat = first.get('risk_category', '')
-                        self.last_message = f"PRED {lesion}: {perc:.0f}% ({cat}) | thr={thr:.3f} -> {first['pred_label']}"
-                    else:
-                        parts = []
-                        for p in preds:
-                            lesion = p.get('lesion', '?')
-                            perc = p.get('risk_percent', p['prob_pos'] * 100.0)
-                            cat = p.get('risk_category', '')
-                            parts.append(f"{lesion}={perc:.0f}%({cat})")
-                        summary = ", ".join(parts)
-                        self.last_message = f"PRED: {summary}"
-                    self.toast_message = self.last_message
-                    self.toast_until = time.time() + 8.0
-                    print("HUD prediction toast enabled")
+        dicom_dir = Path(self.meta['series_dir']) if (self.meta and 'series_dir' in self.meta) else Path(self.dicom_root or '')
+        rois = [dict(roi) for roi in self.rois] # snapshot: o usuario pode seguir anotando
+        # sitk.Image montado no worker se ainda nao existe (copia o volume inteiro)
+        fut = self._io_pool.submit(self._run_export_job, export_case_dir, self._sitk_img, self.np_vol, self.meta,
+                                   rois, case_name, dicom_dir)
+        self.last_message = f"Export {case_name}/{timestamp}: mascaras e inferencia..."
+
+        timer = self.fig.canvas.new_timer(interval=100) if self.fig else None
+        if timer is None or type(timer) is TimerBase:
+            # sem loop de eventos: espera o resultado aqui mesmo
+            self._apply_export_result(case_idx, case_name, timestamp, export_case_dir, fut.result())
+            return
+        timer.add_callback(self._poll_export_job, fut, timer, case_idx, case_name, timestamp, export_case_dir)
+        self._io_timers.add(timer)
+        timer.start()
+        self._schedule_update()
+
+    @staticmethod
+    def _run_export_job(export_case_dir, sitk_img, np_vol, meta, rois, case_name, dicom_dir):
+        """Mascaras NIfTI + inferencia; roda no pool de I/O. Retorna (etapa, resultado)."""
+        try:
+            if sitk_img is None:
+                sitk_img = ViewerApp._image_from_volume(np_vol, meta)
+            mask_export.export_roi_masks(export_case_dir, sitk_img, rois, case_name)
+        except Exception as e:
+            logger.error("erro_export_pipeline etapa=mascaras: %s", e, exc_info=True)
+            return "export", e
+        try:
+            preds = predict_for_export_folder(dicom_dir=dicom_dir, export_dir=Path(export_case_dir))
+        except Exception as e:
+            logger.warning("erro_inferencia dir=%s: %s", export_case_dir, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return "infer", e
+        return "ok", preds
+
+    def _poll_export_job(self, fut, timer, case_idx, case_name, timestamp, export_case_dir):
+        """Callback do timer (thread da UI): aplica o resultado quando o job termina."""
+        if not fut.done():
+            return
+        timer.stop()
+        self._io_timers.discard(timer)
+        try:
+            result = fut.result()
+        except Exception as e:
+            result = ("export", e)
+        self._apply_export_result(case_idx, case_name, timestamp, export_case_dir, result)
+
+    def _apply_export_result(self, case_idx, case_name, timestamp, export_case_dir, result):
+        stage, value = result
+        current = self.cases_list[self.current_case_idx] if self.current_case_idx < len(self.cases_list) else None
+        if (self.current_case_idx, current) != (case_idx, case_name):
+            # paciente trocado durante o job: os ids L1, L2... colidem entre casos, entao
+            # nada do resultado vai para a vista atual (os arquivos ja estao no disco)
+            logger.info("export_outro_caso case=%s etapa=%s dir=%s", case_name, stage, export_case_dir)
+            return
+        if stage == "export":
+            self.last_message = f"ERRO no export: {str(value)[:20]}..."
+            self._schedule_update()
+            return
+
+        self.last_message = f"Export OK: {case_name}/{timestamp}"
+        self.last_export_dir = export_case_dir
+        logger.info("export_pipeline_ok dir=%s", export_case_dir)
+
+        if stage == "infer":
+            self.last_message = f"INFER ERROR: {value}"
+            self._schedule_update()
+            return
+
+        preds = value
+        try:
+            if preds:
+                self.last_preds = preds
+                self.roi_pred_map = {}
+                for p in preds:
+                    lid = p.get("lesion")
+                    if lid:
+                        self.roi_pred_map[lid] = p
+                self._rois_version += 1 # cores/rotulos das ROIs dependem das predicoes
+                if len(preds) == 1:
+                    first = preds[0]
+                    thr = first.get('thr_cv', first.get('threshold', 0.5))
+                    lesion = first.get('lesion', 'ROI')
+                    perc = first.get('risk_percent', first['prob_pos'] * 100.0)
+                    cat = first.get('risk_category', '')
+                    self.last_message = f"PRED {lesion}: {perc:.0f}% ({cat}) | thr={thr:.3f} -> {first['pred_label']}"
                 else:
-                    self.last_message = "INFER ERROR: sem resultados"
-            except Exception as e:
-                self.last_message = f"INFER ERROR: {e}"
+                    parts = []
+                    for p in preds:
+                        lesion = p.get('lesion', '?')
+                        perc = p.get('risk_percent', p['prob_pos'] * 100.0)
+                        cat = p.get('risk_category', '')
+                        parts.append(f"{lesion}={perc:.0f}%({cat})")
+                    summary = ", ".join(parts)
+                    self.last_message = f"PRED: {summary}"
+                self.toast_message = self.last_message
+                self.toast_until = time.monotonic() + 8.0
+                logger.debug("toast_predicao n=%d", len(preds))
+            else:
+                self.last_message = "INFER ERROR: sem resultados"
         except Exception as e:
-            self.last_message = f"ERRO no export: {str(e)[:20]}..."
-            print(f"[ERROR] Falha no export pipeline: {e}")
-            logger.exception("erro_export_pipeline")
-            traceback.print_exc()
+            self.last_message = f"INFER ERROR: {e}"
+            logger.warning("erro_resultado_inferencia: %s", e)
         
-        self.update_plot()
+        self._schedule_update()
 
     def on_report_click(self, event):
         """Callback do botão de relatório."""
@@ -2577,7 +3490,7 @@ class ViewerApp:
         if not self.last_export_dir or not os.path.exists(self.last_export_dir):
             self.last_message = "AVISO: Exporte (tecla E) antes de gerar relatorio!"
             self.toast_message = "Exporte (E) primeiro!"
-            self.toast_until = time.time() + 4.0
+            self.toast_until = time.monotonic() + 4.0
             self.update_plot()
             return
 
@@ -2605,7 +3518,7 @@ class ViewerApp:
             if success:
                 self.last_message = f"PDF Gerado: {pdf_name}"
                 self.toast_message = "PDF OK! (Abrindo pasta...)"
-                self.toast_until = time.time() + 5.0
+                self.toast_until = time.monotonic() + 5.0
                 print(f"[INFO] Relatorio PDF salvo em: {output_path}")
                 self.open_last_export_dir()
             else:
@@ -2620,31 +3533,39 @@ class ViewerApp:
 
     def validate_rois(self):
         """Valida se as ROIs intersectam o volume atual."""
+        if self._series_loading():
+            return
         if not self.rois:
             self.last_message = "AVISO: Nenhuma ROI para validar."
-            self.update_plot()
+            self._schedule_update()
             return
 
         print("\n=== VALIDAÇÃO DE ROIS ===")
         all_valid = True
-        for roi in self.rois:
+        try:
+            # todos os centros de uma vez pela afim em cache
+            size = self.np_vol.shape[::-1] # (x, y, z)
+            centers_mm = np.array([roi['center_mm'] for roi in self.rois], dtype=np.float64)
+            idx = self._m2v_batch(centers_mm)
+            outside = ((idx < -0.5) | (idx > np.asarray(size) - 0.5)).any(axis=1)
+        except Exception:
+            outside = None
+
+        for n, roi in enumerate(self.rois):
             center_mm = roi['center_mm']
-            radius_mm = roi['radius_mm']
             roi_id = roi['id']
             
             try:
-                continuous_idx = self.sitk_img.TransformPhysicalPointToContinuousIndex(center_mm)
-                size = self.sitk_img.GetSize() # (x, y, z)
-                
-                is_outside = False
-                for i in range(3):
-                    if continuous_idx[i] < -0.5 or continuous_idx[i] > size[i] - 0.5:
-                        is_outside = True
-                        break
+                if outside is not None:
+                    is_outside = bool(outside[n])
+                else:
+                    continuous_idx = self.sitk_img.TransformPhysicalPointToContinuousIndex(center_mm)
+                    size = self.sitk_img.GetSize() # (x, y, z)
+                    is_outside = any(continuous_idx[i] < -0.5 or continuous_idx[i] > size[i] - 0.5 for i in range(3))
                 
                 if is_outside:
                     msg = f"WARN: ROI {roi_id} fora do volume!"
-                    print(f"[WARNING] {msg} (Centro: {center_mm}, Volume Size: {size})")
+                    print(f"[WARNING] {msg} (Centro: {center_mm}, Volume Size: {tuple(size)})")
                     self.last_message = msg
                     all_valid = False
             except Exception as e:
@@ -2657,10 +3578,12 @@ class ViewerApp:
             self.last_message = "Todas as ROIs validas no volume atual."
             print("[INFO] Todas as ROIs estao dentro dos limites do volume.")
         
-        self.update_plot()
+        self._schedule_update()
 
     def save_json(self):
         """Exporta JSON completo e padronizado em exports/ com metadados geométricos."""
+        if self._series_loading():
+            return
         case_name = self.cases_list[self.current_case_idx]
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         filename = f"roi_selection_{case_name}_{timestamp}.json"
@@ -2670,6 +3593,15 @@ class ViewerApp:
         
 
         rois_data = []
+        series_by_uid = self._series_by_uid()
+        iso_now = datetime.now().isoformat() # mesmo instante para todas as ROIs do save
+        # geometria da serie e igual para todas as ROIs; o dump so le, entao o dict e compartilhado
+        geom = {
+            "spacing_xyz": list(self.meta['spacing']),
+            "origin_xyz": list(self.meta['origin']),
+            "direction": list(self.meta['direction']),
+            "shape_ijk": list(self.meta['size'])
+        }
         for roi in self.rois:
             s_uid = roi.get('series_uid')
             
@@ -2682,20 +3614,14 @@ class ViewerApp:
                 "center_ijk": roi['center_voxel'],
                 "center_xyz_mm": roi['center_mm'],
                 "radius_mm": roi['radius_mm'],
-                "timestamp_iso": datetime.now().isoformat(),
-                "image_geometry": {
-                    "spacing_xyz": list(self.meta['spacing']),
-                    "origin_xyz": list(self.meta['origin']),
-                    "direction": list(self.meta['direction']),
-                    "shape_ijk": list(self.meta['size'])
-                }
+                "timestamp_iso": iso_now,
+                "image_geometry": geom
             }
             
-            for s in self.series_list:
-                if s['series_uid'] == s_uid:
-                    roi_entry["orientation"] = s['orientation'].upper()
-                    roi_entry["series_name"] = s['series_name']
-                    break
+            s = series_by_uid.get(s_uid)
+            if s:
+                roi_entry["orientation"] = s['orientation'].upper()
+                roi_entry["series_name"] = s['series_name']
             
             rois_data.append(roi_entry)
 
@@ -2707,15 +3633,23 @@ class ViewerApp:
         }
         
         try:
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2, sort_keys=True)
+            # um unico encode em memoria e escrita atomica (tmp + os.replace)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                                       default=lambda o: o.tolist() if hasattr(o, 'tolist') else str(o))
+            else:
+                payload = json.dumps(data, indent=2, sort_keys=True).encode('utf-8')
+            tmp_path = output_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, output_path)
             self.last_message = f"JSON exportado: {filename}"
             print(f"[INFO] Export completo salvo em: {output_path}")
         except Exception as e:
             self.last_message = f"ERRO ao salvar JSON: {str(e)[:20]}..."
             print(f"[ERROR] Falha no export JSON: {e}")
         
-        if self.fig: self.update_plot()
+        self._schedule_update()
 
 def main():
     parser = argparse.ArgumentParser(description="ARARAT Viewer MVP - ProstateX")